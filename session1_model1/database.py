@@ -1,21 +1,35 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from asyncio import current_task
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from models import Base
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./tasks.db"
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./tasks.db"
+
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=current_task)
+
+class SessionManager:
+    """Hands out the current task's session and releases it on exit."""
+
+    async def __aenter__(self) -> AsyncSession:
+        return ScopedSession()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await ScopedSession.remove()
 
-def create_tables():
-    Base.metadata.create_all(bind=engine)
+async def create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionManager() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
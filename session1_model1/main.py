@@ -1,77 +1,112 @@
-from fastapi import FastAPI, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import FastAPI, Depends, HTTPException, Query, Response
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from contextlib import asynccontextmanager
+import orjson
 from models import Task, Status, Priority
-from schemas import TaskCreate, TaskUpdate, TaskResponse
+from schemas import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskOut, TASK_CREATE_LIST_ADAPTER
+)
 from database import get_db, create_tables
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_tables()
+    await create_tables()
     yield
 
 app = FastAPI(title="Task Management API", lifespan=lifespan)
 
+# Columns read for list responses, in TaskOut field order
+TASK_OUT_COLUMNS = (
+    Task.title, Task.description, Task.status, Task.priority,
+    Task.id, Task.created_at
+)
+
 @app.post("/tasks", response_model=TaskResponse, status_code=201)
-def create_task(task: TaskCreate, db: Session = Depends(get_db)):
-    db_task = Task(
-        title=task.title,
-        description=task.description,
-        priority=task.priority,
-        status=Status.PENDING
+async def create_task(task: TaskCreate, db: AsyncSession = Depends(get_db)):
+    # INSERT ... RETURNING hands back id/created_at without a refresh SELECT
+    stmt = (
+        insert(Task)
+        .values(
+            title=task.title,
+            description=task.description,
+            priority=task.priority,
+            status=Status.PENDING
+        )
+        .returning(Task)
     )
-    db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    db_task = (await db.execute(stmt)).scalar_one()
+    await db.commit()
     return db_task
 
+@app.post("/tasks/bulk", response_model=List[TaskResponse], status_code=201)
+async def create_tasks_bulk(tasks: List[TaskCreate], db: AsyncSession = Depends(get_db)):
+    if not tasks:
+        return []
+
+    rows = TASK_CREATE_LIST_ADAPTER.dump_python(tasks)
+    stmt = insert(Task).returning(*TASK_OUT_COLUMNS, sort_by_parameter_order=True)
+    created = (await db.execute(stmt, rows)).all()
+    await db.commit()
+    body = orjson.dumps([TaskOut(*row) for row in created])
+    return Response(content=body, status_code=201, media_type="application/json")
+
 @app.get("/tasks", response_model=List[TaskResponse])
-def get_tasks(
+async def get_tasks(
     status: Optional[str] = Query(None),
     priority: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(Task)
+    # Plain column select: rows come back as mappings, no ORM instances
+    query = select(*TASK_OUT_COLUMNS)
 
     if status:
         try:
             status_enum = Status(status.lower())
-            query = query.filter(Task.status == status_enum)
+            query = query.where(Task.status == status_enum)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid status value")
 
     if priority:
         try:
             priority_enum = Priority(priority.lower())
-            query = query.filter(Task.priority == priority_enum)
+            query = query.where(Task.priority == priority_enum)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid priority value")
 
-    tasks = query.all()
-    return tasks
+    rows = (await db.execute(query)).mappings().all()
+    # Rows come from our own table, so skip response_model validation and
+    # let orjson write the dataclasses straight to bytes.
+    body = orjson.dumps([TaskOut(**row) for row in rows])
+    return Response(content=body, media_type="application/json")
 
 @app.put("/tasks/{task_id}", response_model=TaskResponse)
-def update_task(task_id: int, task_update: TaskUpdate, db: Session = Depends(get_db)):
-    db_task = db.query(Task).filter(Task.id == task_id).first()
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
+async def update_task(task_id: int, task_update: TaskUpdate, db: AsyncSession = Depends(get_db)):
     update_data = task_update.model_dump(exclude_unset=True)
 
-    for field, value in update_data.items():
-        setattr(db_task, field, value)
+    if update_data:
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**update_data)
+            .returning(Task)
+        )
+        db_task = (await db.execute(stmt)).scalar_one_or_none()
+    else:
+        db_task = await db.get(Task, task_id)
 
-    db.commit()
-    db.refresh(db_task)
+    if not db_task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    await db.commit()
     return db_task
 
 @app.delete("/tasks/{task_id}", status_code=204)
-def delete_task(task_id: int, db: Session = Depends(get_db)):
-    db_task = db.query(Task).filter(Task.id == task_id).first()
-    if not db_task:
+async def delete_task(task_id: int, db: AsyncSession = Depends(get_db)):
+    result = await db.execute(delete(Task).where(Task.id == task_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    db.delete(db_task)
-    db.commit()
+    await db.commit()
     return None
\ No newline at end of file
@@ -1,26 +1,28 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Index
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 import enum
 
 Base = declarative_base()
 
-class Status(enum.Enum):
+class Status(str, enum.Enum):
     PENDING = "pending"
     IN_PROGRESS = "in-progress"
     COMPLETED = "completed"
 
-class Priority(enum.Enum):
+class Priority(str, enum.Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_task_status_priority", "status", "priority"),)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    status = Column(Enum(Status), default=Status.PENDING, nullable=False)
-    priority = Column(Enum(Priority), nullable=False)
+    # Stored as plain enum values; the str enums compare equal to them
+    status = Column(String(16), default=Status.PENDING.value, nullable=False)
+    priority = Column(String(16), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
+from dataclasses import dataclass
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from models import Status, Priority
 
 class TaskBase(BaseModel):
@@ -16,12 +17,28 @@ class TaskCreate(BaseModel):
     description: Optional[str] = None
     priority: Priority
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 class TaskUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[Status] = None
     priority: Optional[Priority] = None
 
+    model_config = {"extra": "forbid", "frozen": True}
+
 class TaskResponse(TaskBase):
     id: int
-    created_at: datetime
\ No newline at end of file
+    created_at: datetime
+
+TASK_CREATE_LIST_ADAPTER = TypeAdapter(List[TaskCreate])
+
+@dataclass(slots=True)
+class TaskOut:
+    """Unvalidated projection of a stored task, serialized with orjson."""
+    title: str
+    description: Optional[str]
+    status: str
+    priority: str
+    id: int
+    created_at: datetime
@@ -7,6 +7,8 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from typing import Dict, Any
 import logging
 
+from app.exceptions.task_exceptions import TaskNotFoundException
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,16 +44,16 @@ async def validation_exception_handler(
     exc: RequestValidationError
 ) -> JSONResponse:
     """Handle Pydantic validation errors with detailed information."""
-    errors = []
-
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        errors.append({
-            "field": field_path,
+    # "field" is the location tuple as a JSON array, e.g. ["body", "title"]
+    errors = [
+        {
+            "field": error["loc"],
             "message": error["msg"],
             "type": error["type"],
             "input": error.get("input")
-        })
+        }
+        for error in exc.errors()
+    ]
 
     error_response = APIError.error_response(
         status_code=422,
@@ -60,7 +62,7 @@ async def validation_exception_handler(
         details={"errors": errors}
     )
 
-    logger.warning(f"Validation error: {errors}")
+    logger.warning("Validation error: %r", errors)
 
     return JSONResponse(
         status_code=422,
@@ -81,7 +83,7 @@ async def http_exception_handler(
 
     # Log errors for 5xx status codes
     if exc.status_code >= 500:
-        logger.error(f"Server error: {exc.detail}")
+        logger.error("Server error: %s", exc.detail)
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -89,6 +91,40 @@ async def http_exception_handler(
     )
 
 
+async def task_not_found_handler(
+    request: Request,
+    exc: TaskNotFoundException
+) -> JSONResponse:
+    """Map a missing task to a 404 in the standard HTTP error format."""
+    error_response = APIError.error_response(
+        status_code=404,
+        message=exc.message,
+        error_code="HTTP_ERROR"
+    )
+
+    return JSONResponse(
+        status_code=404,
+        content=error_response
+    )
+
+
+async def value_error_handler(
+    request: Request,
+    exc: ValueError
+) -> JSONResponse:
+    """Map a ValueError raised while handling a request to a 422."""
+    error_response = APIError.error_response(
+        status_code=422,
+        message=str(exc),
+        error_code="VALIDATION_ERROR"
+    )
+
+    return JSONResponse(
+        status_code=422,
+        content=error_response
+    )
+
+
 async def general_exception_handler(
     request: Request,
     exc: Exception
@@ -100,7 +136,9 @@ async def general_exception_handler(
         error_code="INTERNAL_ERROR"
     )
 
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
+    # Only walk the traceback when the record will actually be emitted
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error("Unexpected error: %s", exc, exc_info=True)
 
     return JSONResponse(
         status_code=500,
@@ -1,17 +1,34 @@
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from app.models.database import engine, Base
+from app.models.database import create_tables
 from app.models import task  # Import the Task model to ensure it's registered
 from app.routers import tasks
 from app.core.handlers import (
     validation_exception_handler,
     http_exception_handler,
+    task_not_found_handler,
+    value_error_handler,
     general_exception_handler
 )
+from app.exceptions.task_exceptions import TaskNotFoundException
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create database tables on startup when RUN_MIGRATIONS=1.
+
+    The DDL is opt-in so that only one process (e.g. a release step or a
+    single dev server) runs it, rather than every worker on boot.
+    """
+    if os.getenv("RUN_MIGRATIONS") == "1":
+        await create_tables()
+    yield
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -20,18 +37,36 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan
 )
 
 # Add global exception handlers
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(TaskNotFoundException, task_not_found_handler)
+app.add_exception_handler(ValueError, value_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
 # Include routers
 app.include_router(tasks.router, prefix="/api/v1/tasks", tags=["tasks"])
 
 
+# Constant payloads for the root and health endpoints, encoded once
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to Task Management API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "redoc": "/redoc",
+    "openapi": "/openapi.json"
+})
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Task Management API",
+    "version": "1.0.0"
+})
+
+
 @app.get("/", tags=["root"])
 async def read_root():
     """
@@ -39,13 +74,7 @@ async def read_root():
 
     Returns basic information about the API.
     """
-    return {
-        "message": "Welcome to Task Management API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "openapi": "/openapi.json"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["health"])
@@ -55,8 +84,4 @@ async def health_check():
 
     Returns the health status of the API.
     """
-    return {
-        "status": "healthy",
-        "service": "Task Management API",
-        "version": "1.0.0"
-    }
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
\ No newline at end of file
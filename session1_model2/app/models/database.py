@@ -1,23 +1,112 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import os
+from asyncio import current_task
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./task_management.db"
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import StaticPool
+
+SQLALCHEMY_DATABASE_URL = os.getenv(
+    "DATABASE_URL", "sqlite+aiosqlite:///./task_management.db"
+)
+
+
+def _create_engine(url: str):
+    """
+    Build the async engine for the configured database.
+
+    Server databases get a sized connection pool with pre-ping so that
+    concurrent requests hold distinct connections and stale sockets are
+    detected before use. SQLite keeps its file-backed default, switched to
+    WAL journaling; in-memory SQLite (tests) shares a single connection.
+    """
+    if not url.startswith("sqlite"):
+        return create_async_engine(
+            url,
+            pool_size=20,
+            max_overflow=10,
+            pool_timeout=30,
+            pool_pre_ping=True,
+            pool_recycle=3600
+        )
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    if ":memory:" in url or url.endswith("://"):
+        return create_async_engine(url, poolclass=StaticPool)
+
+    sqlite_engine = create_async_engine(url)
+
+    @event.listens_for(sqlite_engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return sqlite_engine
+
+
+engine = _create_engine(SQLALCHEMY_DATABASE_URL)
+
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# One session per asyncio task (i.e. per request), reused by every
+# SessionManager block entered within that task.
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=current_task)
+
+# Sessions for read-only routes: AUTOCOMMIT connections skip the
+# BEGIN/COMMIT pair, and nothing is ever flushed.
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 Base = declarative_base()
 
-def get_db():
+
+class SessionManager:
+    """
+    Async context manager around the task-scoped session.
+
+    The session is closed and released from the registry on exit, so its
+    pool checkout never outlives the ``async with`` block.
+    """
+
+    async def __aenter__(self) -> AsyncSession:
+        return ScopedSession()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await ScopedSession.remove()
+
+
+async def create_tables() -> None:
+    """Create any missing tables for the registered models."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def get_db():
     """
     Dependency to get a database session.
     This will be used in the endpoints to get a database session.
     """
-    db = SessionLocal()
-    try:
+    async with SessionManager() as db:
+        yield db
+
+
+async def get_readonly_db():
+    """
+    Dependency to get a session for routes that only read.
+
+    The session runs in autocommit mode and must not be used for writes.
+    """
+    async with ReadOnlySessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
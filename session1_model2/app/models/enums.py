@@ -13,12 +13,12 @@ class TaskStatus(str, Enum):
     @classmethod
     def values(cls):
         """Get all possible status values."""
-        return [status.value for status in cls]
+        return _STATUS_VALUES
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Check if a status value is valid."""
-        return value in cls.values()
+        return value in _STATUS_VALUE_SET
 
 
 class TaskPriority(str, Enum):
@@ -31,9 +31,17 @@ class TaskPriority(str, Enum):
     @classmethod
     def values(cls):
         """Get all possible priority values."""
-        return [priority.value for priority in cls]
+        return _PRIORITY_VALUES
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         """Check if a priority value is valid."""
-        return value in cls.values()
\ No newline at end of file
+        return value in _PRIORITY_VALUE_SET
+
+
+# Computed once: values() hands out the tuple, is_valid() checks the set.
+_STATUS_VALUES = tuple(status.value for status in TaskStatus)
+_STATUS_VALUE_SET = frozenset(_STATUS_VALUES)
+
+_PRIORITY_VALUES = tuple(priority.value for priority in TaskPriority)
+_PRIORITY_VALUE_SET = frozenset(_PRIORITY_VALUES)
@@ -1,8 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index, DDL, event
+from sqlalchemy.dialects.sqlite import DATETIME as SQLITE_DATETIME
 from sqlalchemy.sql import func
 from app.models.database import Base
 from app.models.enums import TaskStatus, TaskPriority
 
+# SQLite's CURRENT_TIMESTAMP stores whole seconds as text. Bind datetimes in
+# the same form so comparisons against stored values (e.g. keyset cursors)
+# line up instead of tripping over a trailing ".000000".
+_SQLITE_TIMESTAMP = SQLITE_DATETIME(
+    storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+)
+
+
 class Task(Base):
     """
     Task model for the task management system.
@@ -17,24 +26,51 @@ class Task(Base):
         updated_at: Timestamp when the task was last updated.
     """
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Matches the status/priority equality filters on the list and count
+        # endpoints; status alone can use the leading column.
+        Index("ix_task_status_priority", "status", "priority"),
+        # Serves the ORDER BY created_at DESC, id DESC used for list and
+        # keyset pagination.
+        Index("ix_task_created_at_id", "created_at", "id"),
+        # A single status or priority filter plus that ordering: the range
+        # scan already returns rows in order, so no sort step is needed.
+        Index("ix_task_status_created_at", "status", "created_at", "id"),
+        Index("ix_task_priority_created_at", "priority", "created_at", "id"),
+        # PostgreSQL only: trigram GIN indexes let the unanchored
+        # ILIKE '%term%' search use an index instead of a sequential scan.
+        Index(
+            "ix_task_title_trgm", "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_task_description_trgm", "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, comment="Unique identifier for the task")
     title = Column(String(200), nullable=False, index=True, comment="Title of the task")
     description = Column(Text, nullable=True, comment="Detailed description of the task")
+    # Enum columns are stored as their plain string values; TaskStatus and
+    # TaskPriority are str enums, so comparisons against them still hold
+    # and rows load without per-value enum conversion.
     status = Column(
-        Enum(TaskStatus),
-        default=TaskStatus.PENDING,
+        String(16),
+        default=TaskStatus.PENDING.value,
         nullable=False,
         comment="Current status of the task"
     )
     priority = Column(
-        Enum(TaskPriority),
-        default=TaskPriority.MEDIUM,
+        String(16),
+        default=TaskPriority.MEDIUM.value,
         nullable=False,
         comment="Priority level of the task"
     )
     created_at = Column(
-        DateTime(timezone=True),
+        DateTime(timezone=True).with_variant(_SQLITE_TIMESTAMP, "sqlite"),
         server_default=func.now(),
         nullable=False,
         comment="Timestamp when task was created"
@@ -49,7 +85,7 @@ class Task(Base):
     def __repr__(self) -> str:
         return (
             f"<Task(id={self.id}, title='{self.title}', "
-            f"status='{self.status.value}', priority='{self.priority.value}')>"
+            f"status='{self.status}', priority='{self.priority}')>"
         )
 
     @property
@@ -60,4 +96,12 @@ class Task(Base):
     @property
     def is_active(self) -> bool:
         """Check if the task is active (pending or in-progress)."""
-        return self.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
\ No newline at end of file
+        return self.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
+
+
+# The trigram operator classes come from the pg_trgm extension
+event.listen(
+    Task.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
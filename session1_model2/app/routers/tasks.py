@@ -1,14 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.models.database import get_db
+import orjson
+from app.models.database import get_db, get_readonly_db
 from app.models.enums import TaskStatus, TaskPriority
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
-from app.services.task_service import TaskService
-from app.exceptions.task_exceptions import TaskNotFoundException, DatabaseOperationException
+from app.schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskSummaryResponse, TaskOut, TaskSummaryOut
+)
+from app.services.task_service import TaskService, TASK_SUMMARY_COLUMNS
+from sqlalchemy.exc import IntegrityError, OperationalError
+from app.exceptions.task_exceptions import TaskNotFoundException
+from app.utils import cache
+from app.utils.etag import etag_for, etag_matches
 
 router = APIRouter()
 
+# Largest batch accepted by POST /bulk
+MAX_BULK_TASKS = 500
+
+
+# The enum listings never change, so their JSON bodies are encoded once.
+_STATUS_LIST_BODY = orjson.dumps({
+    "statuses": TaskStatus.values(),
+    "description": {
+        "pending": "Task is not started",
+        "in-progress": "Task is currently being worked on",
+        "completed": "Task is finished"
+    }
+})
+_PRIORITY_LIST_BODY = orjson.dumps({
+    "priorities": TaskPriority.values(),
+    "description": {
+        "low": "Low priority task",
+        "medium": "Medium priority task",
+        "high": "High priority task"
+    }
+})
+
 
 @router.get("/", response_model=List[TaskResponse], status_code=200)
 async def get_tasks(
@@ -17,7 +45,7 @@ async def get_tasks(
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
     search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_readonly_db)
 ):
     """
     Retrieve all tasks with optional filtering and pagination.
@@ -31,20 +59,41 @@ async def get_tasks(
         db: Database session
 
     Returns:
-        List of tasks matching the criteria
+        List of tasks matching the criteria; the X-Total-Count header holds
+        the number of matches ignoring skip/limit
     """
-    try:
-        tasks = TaskService.get_all_tasks(
-            db=db,
-            skip=skip,
-            limit=limit,
-            status=status,
-            priority=priority,
-            search=search
+    # Search goes last since it is the only part that may contain ":"
+    cache_key = (
+        f"list:{status and status.value}:{priority and priority.value}:"
+        f"{skip}:{limit}:{search}"
+    )
+    cached = await cache.get_cached(cache_key)
+    if cached is not None:
+        total, _, body = cached.partition(b"\n")
+        return Response(
+            content=body,
+            media_type="application/json",
+            headers={"X-Total-Count": total.decode()}
         )
-        return tasks
-    except Exception as e:
-        raise DatabaseOperationException(str(e))
+
+    rows, total = await TaskService.get_tasks_with_total(
+        db=db,
+        skip=skip,
+        limit=limit,
+        status=status,
+        priority=priority,
+        search=search
+    )
+    # Rows are trusted, so bypass response_model validation and let
+    # orjson write the dataclass projections straight to bytes. The
+    # trailing window-count column is dropped from each row.
+    body = orjson.dumps([TaskOut(*row[:-1]) for row in rows])
+    await cache.set_cached(cache_key, f"{total}\n".encode() + body)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Total-Count": str(total)}
+    )
 
 
 @router.get("/count", status_code=200)
@@ -52,7 +101,7 @@ async def get_tasks_count(
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
     search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_readonly_db)
 ):
     """
     Get the total count of tasks matching the filters.
@@ -66,22 +115,56 @@ async def get_tasks_count(
     Returns:
         Dictionary with total count
     """
-    try:
-        total = TaskService.get_task_count(
-            db=db,
-            status=status,
-            priority=priority,
-            search=search
-        )
-        return {"total": total}
-    except Exception as e:
-        raise DatabaseOperationException(str(e))
+    cache_key = f"count:{status and status.value}:{priority and priority.value}:{search}"
+    cached = await cache.get_cached(cache_key)
+    if cached is not None:
+        return {"total": int(cached)}
+
+    total = await TaskService.get_task_count(
+        db=db,
+        status=status,
+        priority=priority,
+        search=search
+    )
+    await cache.set_cached(cache_key, str(total).encode())
+    return {"total": total}
+
+
+@router.get("/summary", response_model=List[TaskSummaryResponse], status_code=200)
+async def get_task_summaries(
+    skip: int = Query(0, ge=0, description="Number of tasks to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks to return"),
+    status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
+    search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
+    db: AsyncSession = Depends(get_readonly_db)
+):
+    """
+    Retrieve tasks without their descriptions.
+
+    Same filtering, ordering and pagination as the full listing, but the
+    description column is never read, keeping rows narrow for list views.
+
+    Returns:
+        List of task summaries matching the criteria
+    """
+    rows = await TaskService.get_all_tasks(
+        db=db,
+        skip=skip,
+        limit=limit,
+        status=status,
+        priority=priority,
+        search=search,
+        columns=TASK_SUMMARY_COLUMNS
+    )
+    body = orjson.dumps([TaskSummaryOut(**row) for row in rows])
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/", response_model=TaskResponse, status_code=201)
 async def create_task(
     task: TaskCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new task.
@@ -94,15 +177,46 @@ async def create_task(
         Created task data
     """
     try:
-        created_task = TaskService.create_task(db=db, task_data=task)
+        created_task = await TaskService.create_task(db=db, task_data=task)
         return created_task
-    except Exception as e:
+    except (IntegrityError, OperationalError) as e:
         raise HTTPException(
             status_code=400,
             detail=f"Failed to create task: {str(e)}"
         )
 
 
+@router.post("/bulk", response_model=List[TaskResponse], status_code=201)
+async def create_tasks_bulk(
+    tasks: List[TaskCreate] = Body(..., max_length=MAX_BULK_TASKS),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create multiple tasks in a single request.
+
+    All tasks are inserted with one INSERT ... RETURNING statement and one
+    commit.
+
+    Args:
+        tasks: List of task creation data (at most MAX_BULK_TASKS)
+        db: Database session
+
+    Returns:
+        Created tasks, in request order
+    """
+    try:
+        rows = await TaskService.create_tasks_bulk(db=db, tasks_data=tasks)
+    except (IntegrityError, OperationalError) as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to create tasks: {str(e)}"
+        )
+
+    # Same direct serialization path as the list endpoint
+    body = orjson.dumps([TaskOut(*row) for row in rows])
+    return Response(content=body, status_code=201, media_type="application/json")
+
+
 @router.get("/status/list", status_code=200)
 async def get_task_status_list():
     """
@@ -111,14 +225,7 @@ async def get_task_status_list():
     Returns:
         List of available task statuses
     """
-    return {
-        "statuses": TaskStatus.values(),
-        "description": {
-            "pending": "Task is not started",
-            "in-progress": "Task is currently being worked on",
-            "completed": "Task is finished"
-        }
-    }
+    return Response(content=_STATUS_LIST_BODY, media_type="application/json")
 
 
 @router.get("/priority/list", status_code=200)
@@ -129,50 +236,49 @@ async def get_task_priority_list():
     Returns:
         List of available task priorities
     """
-    return {
-        "priorities": TaskPriority.values(),
-        "description": {
-            "low": "Low priority task",
-            "medium": "Medium priority task",
-            "high": "High priority task"
-        }
-    }
+    return Response(content=_PRIORITY_LIST_BODY, media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=TaskResponse, status_code=200)
 async def get_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_readonly_db)
 ):
     """
     Retrieve a specific task by ID.
 
+    The response carries an ETag hashed from the serialized task; a request
+    whose If-None-Match matches it gets an empty 304 instead of the body.
+
     Args:
         task_id: ID of the task to retrieve
+        request: Incoming request (for If-None-Match)
         db: Database session
 
     Returns:
         Task data
 
     Raises:
-        HTTPException: If task is not found
+        TaskNotFoundException: If task is not found (served as 404)
     """
-    try:
-        task = TaskService.get_task_by_id(db=db, task_id=task_id)
-        if not task:
-            raise TaskNotFoundException(task_id)
-        return task
-    except TaskNotFoundException as e:
-        raise HTTPException(status_code=404, detail=e.message)
-    except Exception as e:
-        raise DatabaseOperationException(str(e))
+    task = await TaskService.get_task_by_id(db=db, task_id=task_id)
+    if not task:
+        raise TaskNotFoundException(task_id)
+
+    body = TaskResponse.model_validate(task).model_dump_json().encode()
+    etag = etag_for(body)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.put("/{task_id}", response_model=TaskResponse, status_code=200)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing task.
@@ -186,30 +292,30 @@ async def update_task(
         Updated task data
 
     Raises:
-        HTTPException: If task is not found or update fails
+        TaskNotFoundException: If task is not found (served as 404)
+        HTTPException: If the update fails
     """
     try:
-        updated_task = TaskService.update_task(
+        updated_task = await TaskService.update_task(
             db=db,
             task_id=task_id,
             task_data=task_update
         )
-        if not updated_task:
-            raise TaskNotFoundException(task_id)
-        return updated_task
-    except TaskNotFoundException as e:
-        raise HTTPException(status_code=404, detail=e.message)
-    except Exception as e:
+    except (IntegrityError, OperationalError) as e:
         raise HTTPException(
             status_code=400,
             detail=f"Failed to update task: {str(e)}"
         )
 
+    if not updated_task:
+        raise TaskNotFoundException(task_id)
+    return updated_task
+
 
 @router.delete("/{task_id}", status_code=204)
 async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a task.
@@ -219,15 +325,10 @@ async def delete_task(
         db: Database session
 
     Raises:
-        HTTPException: If task is not found
+        TaskNotFoundException: If task is not found (served as 404)
     """
-    try:
-        deleted = TaskService.delete_task(db=db, task_id=task_id)
-        if not deleted:
-            raise TaskNotFoundException(task_id)
-        # No content to return for successful deletion
-        return
-    except TaskNotFoundException as e:
-        raise HTTPException(status_code=404, detail=e.message)
-    except Exception as e:
-        raise DatabaseOperationException(str(e))
\ No newline at end of file
+    deleted = await TaskService.delete_task(db=db, task_id=task_id)
+    if not deleted:
+        raise TaskNotFoundException(task_id)
+    # No content to return for successful deletion
+    return
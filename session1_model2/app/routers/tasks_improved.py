@@ -1,24 +1,86 @@
 """Improved Task router with better error handling and structure."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
+import orjson
 
 from app.models.database import get_db
 from app.models.enums import TaskStatus, TaskPriority
-from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse
+from app.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskOut
 from app.services.task_service import TaskService
 from app.exceptions.task_exceptions import TaskNotFoundException
-from app.utils.pagination import PaginationParams, PaginatedResponse
+from app.utils.pagination import (
+    PaginationParams, PaginatedResponse, encode_cursor, decode_cursor,
+    pagination_dependency, pagination_params
+)
+from app.utils.cache import cached
+from app.utils.etag import etag_for, etag_matches
 
 router = APIRouter()
 
+# The paginated envelope uses smaller pages: 10 by default, up to 100
+page_params = pagination_dependency(default_limit=10, max_limit=100)
+
+
+def _query_key(endpoint: str):
+    """Build a cache key function over an endpoint's filter parameters."""
+    def build(status=None, priority=None, search=None, skip=None, limit=None,
+              pagination=None, **_):
+        if pagination is not None:
+            skip, limit = pagination.skip, pagination.limit
+        # Search goes last since it is the only part that may contain ":"
+        return (
+            f"{endpoint}:{skip}:{limit}:{status and status.value}:"
+            f"{priority and priority.value}:{search}"
+        )
+    return build
+
+
+def _encode_task(task) -> bytes:
+    return TaskResponse.model_validate(task).model_dump_json().encode()
+
+
+# Pages larger than this are streamed instead of built in memory
+_STREAM_THRESHOLD = 100
+
+
+async def _stream_json_array(batches) -> AsyncIterator[bytes]:
+    """Encode batches of task rows as one JSON array, a batch at a time."""
+    yield b"["
+    separator = b""
+    async for batch in batches:
+        yield separator + b",".join(orjson.dumps(TaskOut(**row)) for row in batch)
+        separator = b","
+    yield b"]"
+
+# The enum listings never change, so their JSON bodies are encoded once.
+_STATUS_LIST_BODY = orjson.dumps({
+    "statuses": TaskStatus.values(),
+    "default": TaskStatus.PENDING.value,
+    "descriptions": {
+        "pending": "Task is not started yet",
+        "in-progress": "Task is currently being worked on",
+        "completed": "Task has been finished"
+    }
+})
+_PRIORITY_LIST_BODY = orjson.dumps({
+    "priorities": TaskPriority.values(),
+    "default": TaskPriority.MEDIUM.value,
+    "descriptions": {
+        "low": "Low priority task (can be deferred)",
+        "medium": "Normal priority task",
+        "high": "High priority task (urgent)"
+    }
+})
+
 
 @router.get("/", response_model=List[TaskResponse], status_code=200)
+@cached(_query_key("improved-list"), ttl=30)
 async def get_tasks(
-    skip: int = Query(0, ge=0, description="Number of tasks to skip for pagination"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks to return (max: 1000)"),
+    pagination: PaginationParams = Depends(pagination_params),
     status: Optional[TaskStatus] = Query(None, description="Filter tasks by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter tasks by priority"),
     search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
@@ -32,7 +94,7 @@ async def get_tasks(
         regex="^(asc|desc)$",
         description="Sort order (asc or desc)"
     ),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve all tasks with comprehensive filtering, sorting, and pagination.
@@ -50,15 +112,14 @@ async def get_tasks(
     - **skip**: Number of records to skip
     - **limit**: Number of records to return (1-1000)
 
+    Pages of more than 100 tasks are streamed as they are read from the
+    database and are not cached.
+
     Returns:
         List of tasks matching the criteria
     """
-    try:
-        # Validate pagination parameters
-        pagination = PaginationParams(skip=skip, limit=limit, max_limit=1000)
-
-        # Get tasks with filters
-        tasks = TaskService.get_all_tasks(
+    if pagination.page_size > _STREAM_THRESHOLD:
+        batches = TaskService.iter_tasks(
             db=db,
             skip=pagination.offset,
             limit=pagination.page_size,
@@ -66,33 +127,37 @@ async def get_tasks(
             priority=priority,
             search=search
         )
+        return StreamingResponse(
+            _stream_json_array(batches), media_type="application/json"
+        )
 
-        # Note: Sorting would need to be implemented in the service layer
-        # For now, we'll return the tasks as ordered by created_at desc
+    # Get tasks with filters
+    tasks = await TaskService.get_all_tasks(
+        db=db,
+        skip=pagination.offset,
+        limit=pagination.page_size,
+        status=status,
+        priority=priority,
+        search=search
+    )
 
-        return tasks
+    # Note: Sorting would need to be implemented in the service layer
+    # For now, we'll return the tasks as ordered by created_at desc
 
-    except ValueError as e:
-        # Handle validation errors that aren't caught by Pydantic
-        raise HTTPException(
-            status_code=422,
-            detail=f"Validation error: {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error while retrieving tasks"
-        )
+    # Rows are trusted; encode the projections with orjson directly
+    # instead of revalidating them against response_model.
+    body = orjson.dumps([TaskOut(**row) for row in tasks])
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/paginated", status_code=200)
+@cached(_query_key("improved-paginated"), ttl=30)
 async def get_tasks_paginated(
-    skip: int = Query(0, ge=0, description="Number of tasks to skip for pagination"),
-    limit: int = Query(10, ge=1, le=100, description="Number of tasks per page (max: 100)"),
+    pagination: PaginationParams = Depends(page_params),
     status: Optional[TaskStatus] = Query(None, description="Filter tasks by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter tasks by priority"),
     search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve tasks with pagination metadata.
@@ -100,99 +165,101 @@ async def get_tasks_paginated(
     Returns a paginated response with metadata about total items,
     current page, and navigation info.
     """
-    try:
-        pagination = PaginationParams(skip=skip, limit=limit, max_limit=100)
-
-        # Get tasks and total count
-        tasks = TaskService.get_all_tasks(
-            db=db,
-            skip=pagination.offset,
-            limit=pagination.page_size,
-            status=status,
-            priority=priority,
-            search=search
-        )
-
-        total = TaskService.get_task_count(
-            db=db,
-            status=status,
-            priority=priority,
-            search=search
-        )
-
-        # Create paginated response
-        response = PaginatedResponse.create(
-            items=tasks,
-            total=total,
-            pagination=pagination
-        )
-
-        return response
+    # Page and total count from one windowed query
+    rows, total = await TaskService.get_tasks_with_total(
+        db=db,
+        skip=pagination.offset,
+        limit=pagination.page_size,
+        status=status,
+        priority=priority,
+        search=search
+    )
+
+    # Create paginated response; the trailing total column is dropped
+    response = PaginatedResponse.create(
+        items=[TaskOut(*row[:-1]) for row in rows],
+        total=total,
+        pagination=pagination
+    )
+
+    # Encode the whole envelope in one orjson pass rather than walking
+    # each item through jsonable_encoder
+    return Response(content=orjson.dumps(response), media_type="application/json")
+
+
+@router.get("/cursor", status_code=200)
+async def get_tasks_by_cursor(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(10, ge=1, le=100, description="Number of tasks per page (max: 100)"),
+    status: Optional[TaskStatus] = Query(None, description="Filter tasks by status"),
+    priority: Optional[TaskPriority] = Query(None, description="Filter tasks by priority"),
+    search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retrieve tasks with keyset (cursor) pagination.
 
-    except ValueError as e:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Validation error: {str(e)}"
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error while retrieving tasks"
-        )
+    Pages follow the newest-first order. Pass the returned next_cursor to
+    get the following page; it is null on the last page. Unlike skip-based
+    pagination, the cost of a page does not grow with its depth.
+    """
+    after = decode_cursor(cursor) if cursor else None
+
+    # Fetch one extra row to learn whether another page exists
+    rows = await TaskService.get_tasks_after(
+        db=db,
+        after=after,
+        limit=limit + 1,
+        status=status,
+        priority=priority,
+        search=search
+    )
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_next else None
+
+    body = orjson.dumps({
+        "items": [TaskOut(*row) for row in rows],
+        "next_cursor": next_cursor
+    })
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/count", status_code=200)
+@cached(_query_key("improved-stats"), ttl=30)
 async def get_tasks_count(
     status: Optional[TaskStatus] = Query(None, description="Filter by task status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by task priority"),
     search: Optional[str] = Query(None, min_length=1, description="Search in title and description"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get statistics about tasks.
 
     Returns total count of tasks with optional filters applied.
     """
-    try:
-        total = TaskService.get_task_count(
-            db=db,
-            status=status,
-            priority=priority,
-            search=search
-        )
+    # Filtered total plus unfiltered breakdowns, from a single statement
+    stats = await TaskService.get_full_stats(
+        db=db,
+        status=status,
+        priority=priority,
+        search=search
+    )
 
-        # Get counts by status
-        status_counts = {}
-        for s in TaskStatus:
-            status_counts[s.value] = TaskService.get_task_count(db=db, status=s)
-
-        # Get counts by priority
-        priority_counts = {}
-        for p in TaskPriority:
-            priority_counts[p.value] = TaskService.get_task_count(db=db, priority=p)
-
-        return {
-            "total": total,
-            "by_status": status_counts,
-            "by_priority": priority_counts,
-            "active_filters": {
-                "status": status.value if status else None,
-                "priority": priority.value if priority else None,
-                "search": search
-            }
+    return {
+        **stats,
+        "active_filters": {
+            "status": status.value if status else None,
+            "priority": priority.value if priority else None,
+            "search": search
         }
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail="Internal server error while retrieving task statistics"
-        )
+    }
 
 
 @router.post("/", response_model=TaskResponse, status_code=201)
 async def create_task(
     task: TaskCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new task.
@@ -205,17 +272,8 @@ async def create_task(
 
     **Note**: Validation errors will automatically return HTTP 422
     """
-    try:
-        created_task = TaskService.create_task(db=db, task_data=task)
-        return created_task
-
-    except Exception as e:
-        # Don't catch validation errors - let FastAPI handle them (returns 422)
-        # Only catch unexpected database errors
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to create task due to server error"
-        )
+    created_task = await TaskService.create_task(db=db, task_data=task)
+    return created_task
 
 
 @router.get("/status/list", status_code=200)
@@ -226,15 +284,7 @@ async def get_task_status_list():
     Returns all possible task statuses that can be used
     for filtering and creating/updating tasks.
     """
-    return {
-        "statuses": TaskStatus.values(),
-        "default": TaskStatus.PENDING.value,
-        "descriptions": {
-            "pending": "Task is not started yet",
-            "in-progress": "Task is currently being worked on",
-            "completed": "Task has been finished"
-        }
-    }
+    return Response(content=_STATUS_LIST_BODY, media_type="application/json")
 
 
 @router.get("/priority/list", status_code=200)
@@ -245,25 +295,36 @@ async def get_task_priority_list():
     Returns all possible task priorities that can be used
     for filtering and creating/updating tasks.
     """
-    return {
-        "priorities": TaskPriority.values(),
-        "default": TaskPriority.MEDIUM.value,
-        "descriptions": {
-            "low": "Low priority task (can be deferred)",
-            "medium": "Normal priority task",
-            "high": "High priority task (urgent)"
-        }
-    }
+    return Response(content=_PRIORITY_LIST_BODY, media_type="application/json")
+
+
+@cached(lambda task_id, **_: f"task:{task_id}", ttl=300)
+async def _task_response(task_id: int, db: AsyncSession) -> Response:
+    """Serialized task body, cached; a missing task raises a 404."""
+    task = await TaskService.get_task_by_id(db=db, task_id=task_id)
+
+    if not task:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task with ID {task_id} not found"
+        )
+
+    return Response(content=_encode_task(task), media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=TaskResponse, status_code=200)
 async def get_task_by_id(
     task_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve a specific task by its ID.
 
+    The response carries an ETag hashed from the task body, so it is the
+    same for cached and freshly read copies; a matching If-None-Match gets
+    an empty 304.
+
     Args:
         task_id: The unique identifier of the task
 
@@ -274,38 +335,25 @@ async def get_task_by_id(
         404: If task with the specified ID doesn't exist
         422: If task_id is not a valid integer
     """
-    try:
-        if task_id <= 0:
-            raise HTTPException(
-                status_code=422,
-                detail="Task ID must be a positive integer"
-            )
-
-        task = TaskService.get_task_by_id(db=db, task_id=task_id)
-
-        if not task:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Task with ID {task_id} not found"
-            )
-
-        return task
-
-    except HTTPException:
-        # Re-raise HTTP exceptions (404, 422)
-        raise
-    except Exception as e:
+    if task_id <= 0:
         raise HTTPException(
-            status_code=500,
-            detail="Internal server error while retrieving task"
+            status_code=422,
+            detail="Task ID must be a positive integer"
         )
 
+    body = (await _task_response(task_id=task_id, db=db)).body
+    etag = etag_for(body)
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
 
 @router.put("/{task_id}", response_model=TaskResponse, status_code=200)
 async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update an existing task.
@@ -318,41 +366,31 @@ async def update_task(
     Raises:
         404: If task with the specified ID doesn't exist
     """
-    try:
-        if task_id <= 0:
-            raise HTTPException(
-                status_code=422,
-                detail="Task ID must be a positive integer"
-            )
-
-        updated_task = TaskService.update_task(
-            db=db,
-            task_id=task_id,
-            task_data=task_update
+    if task_id <= 0:
+        raise HTTPException(
+            status_code=422,
+            detail="Task ID must be a positive integer"
         )
 
-        if not updated_task:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Task with ID {task_id} not found"
-            )
-
-        return updated_task
+    updated_task = await TaskService.update_task(
+        db=db,
+        task_id=task_id,
+        task_data=task_update
+    )
 
-    except HTTPException:
-        # Re-raise HTTP exceptions (404, 422)
-        raise
-    except Exception as e:
+    if not updated_task:
         raise HTTPException(
-            status_code=500,
-            detail="Internal server error while updating task"
+            status_code=404,
+            detail=f"Task with ID {task_id} not found"
         )
 
+    return updated_task
+
 
 @router.delete("/{task_id}", status_code=204)
 async def delete_task(
     task_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete a task permanently.
@@ -366,29 +404,19 @@ async def delete_task(
     Raises:
         404: If task with the specified ID doesn't exist
     """
-    try:
-        if task_id <= 0:
-            raise HTTPException(
-                status_code=422,
-                detail="Task ID must be a positive integer"
-            )
-
-        deleted = TaskService.delete_task(db=db, task_id=task_id)
-
-        if not deleted:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Task with ID {task_id} not found"
-            )
-
-        # Return 204 No Content on successful deletion
-        return
-
-    except HTTPException:
-        # Re-raise HTTP exceptions (404, 422)
-        raise
-    except Exception as e:
+    if task_id <= 0:
         raise HTTPException(
-            status_code=500,
-            detail="Internal server error while deleting task"
-        )
\ No newline at end of file
+            status_code=422,
+            detail="Task ID must be a positive integer"
+        )
+
+    deleted = await TaskService.delete_task(db=db, task_id=task_id)
+
+    if not deleted:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task with ID {task_id} not found"
+        )
+
+    # Return 204 No Content on successful deletion
+    return
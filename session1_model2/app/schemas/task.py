@@ -1,8 +1,9 @@
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from datetime import datetime
-from typing import Optional, Annotated
+from typing import List, Optional, Annotated
 from app.models.enums import TaskStatus, TaskPriority
-from app.schemas.base import create_enum_validator, ResponseModelMixin
+from app.schemas.base import ResponseModelMixin
 
 
 class TaskBase(BaseModel):
@@ -42,10 +43,6 @@ class TaskBase(BaseModel):
         )
     ]
 
-    # Add validators using the factory function
-    _validate_status = create_enum_validator(TaskStatus, "status")
-    _validate_priority = create_enum_validator(TaskPriority, "priority")
-
     model_config = ConfigDict(
         use_enum_values=True,
         json_schema_extra={
@@ -63,9 +60,12 @@ class TaskCreate(TaskBase):
     """Schema for creating a new task.
 
     Inherits all fields from TaskBase with their validation rules.
+    Unknown fields are rejected and parsed instances are immutable.
     """
 
     model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
         json_schema_extra={
             "example": {
                 "title": "Complete project documentation",
@@ -80,7 +80,8 @@ class TaskCreate(TaskBase):
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task.
 
-    All fields are optional to allow partial updates.
+    All fields are optional to allow partial updates. Unknown fields are
+    rejected and parsed instances are immutable.
     """
 
     title: Annotated[
@@ -118,12 +119,10 @@ class TaskUpdate(BaseModel):
         )
     ]
 
-    # Add validators using the factory function
-    _validate_status = create_enum_validator(TaskStatus, "status")
-    _validate_priority = create_enum_validator(TaskPriority, "priority")
-
     model_config = ConfigDict(
         use_enum_values=True,
+        extra="forbid",
+        frozen=True,
         json_schema_extra={
             "example": {
                 "status": "in-progress",
@@ -173,4 +172,47 @@ class TaskResponse(TaskBase, ResponseModelMixin):
                 "updated_at": None
             }
         }
-    )
\ No newline at end of file
+    )
+
+
+# Compiled once and reused to dump request batches into insert parameters
+TASK_CREATE_LIST_ADAPTER = TypeAdapter(List[TaskCreate])
+
+class TaskSummaryResponse(BaseModel, ResponseModelMixin):
+    """Schema for task list rows without the description."""
+
+    id: int
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(slots=True)
+class TaskOut:
+    """Lightweight task projection for list responses.
+
+    Mirrors the fields of TaskResponse without any validation; rows read
+    back from the database are trusted and serialized directly by orjson.
+    """
+
+    title: str
+    description: Optional[str]
+    status: str
+    priority: str
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+@dataclass(slots=True)
+class TaskSummaryOut:
+    """TaskOut without the description, for summary listings."""
+
+    title: str
+    status: str
+    priority: str
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime]
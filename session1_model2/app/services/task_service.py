@@ -1,27 +1,91 @@
 """Service layer for Task operations."""
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, RowMapping, Select, and_, delete, func, insert, or_, select, update
 from app.models.task import Task, TaskStatus, TaskPriority
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.schemas.task import TaskCreate, TaskUpdate, TASK_CREATE_LIST_ADAPTER
+from app.utils import cache
+
+# Columns returned by list queries, in TaskOut field order
+TASK_LIST_COLUMNS = (
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+# List columns without the potentially large description, in
+# TaskSummaryOut field order
+TASK_SUMMARY_COLUMNS = (
+    Task.title,
+    Task.status,
+    Task.priority,
+    Task.id,
+    Task.created_at,
+    Task.updated_at,
+)
 
 
 class TaskService:
     """Service class for handling Task CRUD operations."""
 
     @staticmethod
-    def get_all_tasks(
-        db: Session,
+    def _filter_conditions(
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None
+    ) -> List:
+        """Build the shared status/priority/search conditions."""
+        conditions = []
+        if status is not None:
+            conditions.append(Task.status == status)
+
+        if priority is not None:
+            conditions.append(Task.priority == priority)
+
+        if search:
+            search_pattern = f"%{search}%"
+            conditions.append(
+                or_(
+                    Task.title.ilike(search_pattern),
+                    Task.description.ilike(search_pattern)
+                )
+            )
+
+        return conditions
+
+    @staticmethod
+    def _apply_filters(
+        query: Select,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None
+    ) -> Select:
+        """Add the shared status/priority/search WHERE clauses to a query."""
+        conditions = TaskService._filter_conditions(status, priority, search)
+        return query.where(*conditions) if conditions else query
+
+    @staticmethod
+    async def get_all_tasks(
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
-        search: Optional[str] = None
-    ) -> List[Task]:
+        search: Optional[str] = None,
+        columns: Sequence = TASK_LIST_COLUMNS
+    ) -> List[RowMapping]:
         """
         Get all tasks with optional filtering.
 
+        Selects plain columns rather than Task entities, so rows skip ORM
+        instance construction and the identity map.
+
         Args:
             db: Database session
             skip: Number of records to skip (for pagination)
@@ -29,34 +93,159 @@ class TaskService:
             status: Filter by task status
             priority: Filter by task priority
             search: Search in title and description
+            columns: Columns to select (default: TASK_LIST_COLUMNS)
 
         Returns:
-            List of tasks matching the criteria
+            List of row mappings (column name -> value) matching the criteria
         """
-        query = db.query(Task)
+        query = TaskService._apply_filters(
+            select(*columns), status, priority, search
+        )
 
-        # Apply filters
-        if status is not None:
-            query = query.filter(Task.status == status)
+        # Apply pagination and ordering
+        query = (
+            query.order_by(Task.created_at.desc(), Task.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.execute(query)
+        return list(result.mappings().all())
 
-        if priority is not None:
-            query = query.filter(Task.priority == priority)
+    @staticmethod
+    async def iter_tasks(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None,
+        batch_size: int = 100
+    ) -> AsyncIterator[List[RowMapping]]:
+        """
+        Stream a page of tasks in batches.
 
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
+        Same query as get_all_tasks, but rows are fetched from a server-side
+        result batch_size at a time, so only one batch is held in memory.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+            status: Filter by task status
+            priority: Filter by task priority
+            search: Search in title and description
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Lists of row mappings in TASK_LIST_COLUMNS order
+        """
+        query = TaskService._apply_filters(
+            select(*TASK_LIST_COLUMNS), status, priority, search
+        )
+        query = (
+            query.order_by(Task.created_at.desc(), Task.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await db.stream(query)
+        async for batch in result.mappings().partitions():
+            yield batch
+
+    @staticmethod
+    async def get_tasks_with_total(
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None
+    ) -> Tuple[List[Row], int]:
+        """
+        Get a page of tasks together with the total number of matches.
+
+        The total is computed in the same statement with COUNT(*) OVER(),
+        so a list plus its count costs one round trip. Only a page past the
+        end of the results needs a separate COUNT query.
+
+        Args:
+            db: Database session
+            skip: Number of records to skip (for pagination)
+            limit: Maximum number of records to return
+            status: Filter by task status
+            priority: Filter by task priority
+            search: Search in title and description
+
+        Returns:
+            Tuple of (rows in TASK_LIST_COLUMNS order, total count); each row
+            carries the total as its last element
+        """
+        query = TaskService._apply_filters(
+            select(*TASK_LIST_COLUMNS, func.count().over().label("total")),
+            status, priority, search
+        )
+
+        query = (
+            query.order_by(Task.created_at.desc(), Task.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = list((await db.execute(query)).all())
+        if rows:
+            return rows, rows[0].total
+        if skip == 0:
+            return rows, 0
+
+        total = await TaskService.get_task_count(
+            db, status=status, priority=priority, search=search
+        )
+        return rows, total
+
+    @staticmethod
+    async def get_tasks_after(
+        db: AsyncSession,
+        after: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Get the page of tasks following a keyset position.
+
+        Rows are ordered by (created_at, id) descending, and each page is a
+        range scan on that index regardless of how deep it is.
+
+        Args:
+            db: Database session
+            after: (created_at, id) of the last row of the previous page,
+                or None for the first page
+            limit: Maximum number of records to return
+            status: Filter by task status
+            priority: Filter by task priority
+            search: Search in title and description
+
+        Returns:
+            Rows in TASK_LIST_COLUMNS order
+        """
+        query = TaskService._apply_filters(
+            select(*TASK_LIST_COLUMNS), status, priority, search
+        )
+
+        if after is not None:
+            created_at, task_id = after
+            query = query.where(
                 or_(
-                    Task.title.ilike(search_pattern),
-                    Task.description.ilike(search_pattern)
+                    Task.created_at < created_at,
+                    and_(Task.created_at == created_at, Task.id < task_id)
                 )
             )
 
-        # Apply pagination and ordering
-        tasks = query.order_by(Task.created_at.desc()).offset(skip).limit(limit).all()
-        return tasks
+        query = query.order_by(Task.created_at.desc(), Task.id.desc()).limit(limit)
+        return list((await db.execute(query)).all())
 
     @staticmethod
-    def get_task_by_id(db: Session, task_id: int) -> Optional[Task]:
+    async def get_task_by_id(db: AsyncSession, task_id: int) -> Optional[Task]:
         """
         Get a single task by ID.
 
@@ -67,10 +256,12 @@ class TaskService:
         Returns:
             Task object if found, None otherwise
         """
-        return db.query(Task).filter(Task.id == task_id).first()
+        # Primary-key lookup: served from the identity map when the task is
+        # already loaded in this session
+        return await db.get(Task, task_id)
 
     @staticmethod
-    def create_task(db: Session, task_data: TaskCreate) -> Task:
+    async def create_task(db: AsyncSession, task_data: TaskCreate) -> Task:
         """
         Create a new task.
 
@@ -81,19 +272,41 @@ class TaskService:
         Returns:
             Created task object
         """
-        db_task = Task(
-            title=task_data.title,
-            description=task_data.description,
-            status=task_data.status,
-            priority=task_data.priority
-        )
-        db.add(db_task)
-        db.commit()
-        db.refresh(db_task)
+        # INSERT ... RETURNING yields the server-generated id and
+        # created_at, so no refresh SELECT is needed after the commit
+        stmt = insert(Task).values(**task_data.model_dump()).returning(Task)
+        db_task = (await db.execute(stmt)).scalar_one()
+        await db.commit()
+        await cache.invalidate()
         return db_task
 
     @staticmethod
-    def update_task(db: Session, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
+    async def create_tasks_bulk(db: AsyncSession, tasks_data: List[TaskCreate]) -> List[Row]:
+        """
+        Create several tasks in one transaction.
+
+        All rows are sent in a single INSERT ... RETURNING statement and
+        committed once.
+
+        Args:
+            db: Database session
+            tasks_data: List of task creation data
+
+        Returns:
+            Created rows in TASK_LIST_COLUMNS order, in request order
+        """
+        if not tasks_data:
+            return []
+
+        rows = TASK_CREATE_LIST_ADAPTER.dump_python(tasks_data)
+        stmt = insert(Task).returning(*TASK_LIST_COLUMNS, sort_by_parameter_order=True)
+        created = list((await db.execute(stmt, rows)).all())
+        await db.commit()
+        await cache.invalidate()
+        return created
+
+    @staticmethod
+    async def update_task(db: AsyncSession, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
         """
         Update an existing task.
 
@@ -105,21 +318,28 @@ class TaskService:
         Returns:
             Updated task object if found and updated, None otherwise
         """
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            return None
-
         # Update fields only if they are provided in the update data
         update_data = task_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
+        if not update_data:
+            return await TaskService.get_task_by_id(db, task_id)
+
+        # Single UPDATE ... RETURNING round trip instead of SELECT + UPDATE + SELECT
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**update_data)
+            .returning(Task)
+        )
+        db_task = (await db.execute(stmt)).scalar_one_or_none()
+        if not db_task:
+            return None
 
-        db.commit()
-        db.refresh(db_task)
+        await db.commit()
+        await cache.invalidate()
         return db_task
 
     @staticmethod
-    def delete_task(db: Session, task_id: int) -> bool:
+    async def delete_task(db: AsyncSession, task_id: int) -> bool:
         """
         Delete a task.
 
@@ -130,17 +350,17 @@ class TaskService:
         Returns:
             True if task was deleted, False if task was not found
         """
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
+        result = await db.execute(delete(Task).where(Task.id == task_id))
+        if result.rowcount == 0:
             return False
 
-        db.delete(db_task)
-        db.commit()
+        await db.commit()
+        await cache.invalidate()
         return True
 
     @staticmethod
-    def get_task_count(
-        db: Session,
+    async def get_task_count(
+        db: AsyncSession,
         status: Optional[TaskStatus] = None,
         priority: Optional[TaskPriority] = None,
         search: Optional[str] = None
@@ -157,21 +377,55 @@ class TaskService:
         Returns:
             Total count of tasks matching the criteria
         """
-        query = db.query(Task)
+        query = TaskService._apply_filters(
+            select(func.count()).select_from(Task), status, priority, search
+        )
 
-        if status is not None:
-            query = query.filter(Task.status == status)
+        return await db.scalar(query)
 
-        if priority is not None:
-            query = query.filter(Task.priority == priority)
+    @staticmethod
+    async def get_full_stats(
+        db: AsyncSession,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        search: Optional[str] = None
+    ) -> Dict:
+        """
+        Get the filtered total and overall breakdowns in one query.
 
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Task.title.ilike(search_pattern),
-                    Task.description.ilike(search_pattern)
-                )
-            )
+        Every number is a COUNT(*) FILTER (WHERE ...) over a single scan of
+        the table, instead of one COUNT plus a GROUP BY per breakdown.
+
+        Args:
+            db: Database session
+            status: Filter the total by task status
+            priority: Filter the total by task priority
+            search: Filter the total by title and description
 
-        return query.count()
\ No newline at end of file
+        Returns:
+            Dictionary with "total" (filtered) and zero-filled "by_status"
+            and "by_priority" mappings (unfiltered)
+        """
+        conditions = TaskService._filter_conditions(status, priority, search)
+        total = func.count()
+        if conditions:
+            total = total.filter(and_(*conditions))
+
+        query = select(
+            total.label("total"),
+            *[
+                func.count().filter(Task.status == s.value).label(f"status_{s.value}")
+                for s in TaskStatus
+            ],
+            *[
+                func.count().filter(Task.priority == p.value).label(f"prio_{p.value}")
+                for p in TaskPriority
+            ]
+        ).select_from(Task)
+        row = (await db.execute(query)).mappings().one()
+
+        return {
+            "total": row["total"],
+            "by_status": {s.value: row[f"status_{s.value}"] for s in TaskStatus},
+            "by_priority": {p.value: row[f"prio_{p.value}"] for p in TaskPriority},
+        }
@@ -0,0 +1,135 @@
+"""Optional Redis cache for task read endpoints."""
+
+import functools
+import logging
+import os
+from typing import Any, Callable, Optional
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
+
+try:
+    from redis import asyncio as redis_asyncio
+    from redis.exceptions import RedisError
+except ImportError:  # redis is an optional dependency
+    redis_asyncio = None
+    RedisError = Exception
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Cached responses live briefly; writes also invalidate them immediately.
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "5"))
+
+_VERSION_KEY = "tasks:version"
+
+_client = None
+
+
+def get_client():
+    """
+    Get the shared Redis client, or None when caching is disabled.
+
+    Caching is enabled only when REDIS_URL is set and the redis package is
+    installed.
+    """
+    global _client
+    if _client is None and REDIS_URL and redis_asyncio is not None:
+        _client = redis_asyncio.from_url(REDIS_URL)
+    return _client
+
+
+async def _versioned_key(client, key: str) -> str:
+    """Prefix a key with the current task data version."""
+    version = await client.get(_VERSION_KEY)
+    return f"tasks:v{int(version or 0)}:{key}"
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """
+    Look up a cached payload.
+
+    Returns None on a miss, when caching is disabled, or if Redis is
+    unreachable, so callers always fall back to the database.
+    """
+    client = get_client()
+    if client is None:
+        return None
+    try:
+        return await client.get(await _versioned_key(client, key))
+    except RedisError as e:
+        logger.warning("Cache read failed: %s", e)
+        return None
+
+
+async def set_cached(key: str, payload: bytes, ttl: Optional[int] = None) -> None:
+    """Store a payload under the current data version with a short TTL."""
+    client = get_client()
+    if client is None:
+        return
+    try:
+        await client.setex(
+            await _versioned_key(client, key), ttl or CACHE_TTL_SECONDS, payload
+        )
+    except RedisError as e:
+        logger.warning("Cache write failed: %s", e)
+
+
+async def invalidate() -> None:
+    """
+    Invalidate every cached task read.
+
+    Bumps the version counter instead of deleting keys, so stale entries
+    simply stop being addressed and expire on their own TTL.
+    """
+    client = get_client()
+    if client is None:
+        return
+    try:
+        await client.incr(_VERSION_KEY)
+    except RedisError as e:
+        logger.warning("Cache invalidation failed: %s", e)
+
+
+def _encode_json(result: Any) -> bytes:
+    if isinstance(result, Response):
+        # Endpoint already produced its JSON body
+        return result.body
+    return orjson.dumps(jsonable_encoder(result))
+
+
+def cached(
+    key_builder: Callable[..., str],
+    ttl: Optional[int] = None,
+    encode: Callable[[Any], bytes] = _encode_json
+):
+    """
+    Cache a JSON endpoint's response body in Redis.
+
+    key_builder receives the endpoint's keyword arguments and returns the
+    cache key. On a hit the stored bytes are returned as-is; on a miss the
+    endpoint runs and its result is encoded with ``encode`` and stored.
+    Exceptions (e.g. 404s) and streamed responses are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if get_client() is None:
+                return await func(*args, **kwargs)
+
+            key = key_builder(**kwargs)
+            payload = await get_cached(key)
+            if payload is not None:
+                return Response(content=payload, media_type="application/json")
+
+            result = await func(*args, **kwargs)
+            if not isinstance(result, StreamingResponse):
+                await set_cached(key, encode(result), ttl)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,25 @@
+"""Entity tags for conditional GETs of JSON bodies."""
+
+import hashlib
+
+from fastapi import Request
+
+
+def etag_for(body: bytes) -> str:
+    """
+    Build a weak ETag from a serialized response body.
+
+    Hashing the body rather than a timestamp means any change to the
+    resource changes the tag, however soon after the previous write.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match covers the given ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
@@ -1,12 +1,20 @@
 """Pagination utilities for API responses."""
 
-from typing import Dict, Any, Optional
+import base64
+import binascii
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 from math import ceil
 
+import orjson
+from fastapi import Query
+
 
 class PaginationParams:
     """Pagination parameters for API requests."""
 
+    __slots__ = ("skip", "limit", "offset", "page_size")
+
     def __init__(
         self,
         skip: int = 0,
@@ -15,16 +23,9 @@ class PaginationParams:
     ):
         self.skip = max(0, skip)
         self.limit = min(max(1, limit), max_limit)
-
-    @property
-    def offset(self) -> int:
-        """Get database offset value."""
-        return self.skip
-
-    @property
-    def page_size(self) -> int:
-        """Get page size."""
-        return self.limit
+        # Database offset and page size, stored as plain attributes
+        self.offset = self.skip
+        self.page_size = self.limit
 
     def get_pagination_info(self, total: int, base_url: str) -> Dict[str, Any]:
         """
@@ -51,6 +52,33 @@ class PaginationParams:
         }
 
 
+def pagination_dependency(default_limit: int = 100, max_limit: int = 1000):
+    """
+    Build a FastAPI dependency that parses skip/limit into PaginationParams.
+
+    Args:
+        default_limit: Page size when limit is not given
+        max_limit: Largest accepted page size
+
+    Returns:
+        Dependency function for use with Depends()
+    """
+    def dependency(
+        skip: int = Query(0, ge=0, description="Number of tasks to skip for pagination"),
+        limit: int = Query(
+            default_limit, ge=1, le=max_limit,
+            description=f"Maximum number of tasks to return (max: {max_limit})"
+        )
+    ) -> PaginationParams:
+        return PaginationParams(skip, limit, max_limit)
+
+    return dependency
+
+
+# Default list paging: 100 per page, up to 1000
+pagination_params = pagination_dependency()
+
+
 class PaginatedResponse:
     """Helper for creating paginated responses."""
 
@@ -76,4 +104,24 @@ class PaginatedResponse:
         return {
             "items": items,
             "pagination": pagination_info
-        }
\ No newline at end of file
+        }
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = orjson.dumps([created_at.isoformat(), task_id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, task_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise ValueError("Invalid cursor")
@@ -1,9 +1,13 @@
 """Startup script for the Task Management API."""
 
+import os
+
 import uvicorn
 from app.main import app
 
 if __name__ == "__main__":
+    # Create tables on startup for the local development server
+    os.environ.setdefault("RUN_MIGRATIONS", "1")
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
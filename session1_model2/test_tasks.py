@@ -1,12 +1,25 @@
-from fastapi.testclient import TestClient
-from app.main import app
+from datetime import datetime, timedelta
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, update
+from app.models.task import Task
+from app.models.enums import TaskStatus, TaskPriority
+from app.services.task_service import TaskService
+from conftest import IMPROVED_PREFIX
 import pytest
 
-client = TestClient(app)
+
+def insert_tasks(app_client, db_session, rows):
+    """Insert task rows in one statement and return their ids in order."""
+    async def insert_rows():
+        stmt = insert(Task).returning(Task.id, sort_by_parameter_order=True)
+        result = await db_session.execute(stmt, rows)
+        return list(result.scalars().all())
+
+    return app_client.portal.call(insert_rows)
 
 
 @pytest.fixture
-def sample_task():
+def sample_task(client):
     """Create a sample task for testing."""
     response = client.post("/api/v1/tasks", json={
         "title": "Buy groceries",
@@ -17,31 +30,25 @@ def sample_task():
 
 
 @pytest.fixture
-def multiple_tasks():
-    """Create multiple tasks for testing filters."""
+def multiple_tasks(app_client, db_session):
+    """Insert multiple tasks in one statement for testing filters."""
     tasks_data = [
         {"title": "Task 1", "status": "pending", "priority": "high"},
         {"title": "Task 2", "status": "completed", "priority": "medium"},
         {"title": "Task 3", "status": "in-progress", "priority": "low"},
         {"title": "Task 4", "status": "completed", "priority": "high"}
     ]
+    return insert_tasks(app_client, db_session, tasks_data)
 
-    task_ids = []
-    for task_data in tasks_data:
-        response = client.post("/api/v1/tasks", json=task_data)
-        task_ids.append(response.json()["id"])
-
-    return task_ids
 
-
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_create_task():
+def test_create_task(client):
     """Test creating a new task."""
     response = client.post("/api/v1/tasks", json={
         "title": "Buy groceries",
@@ -58,7 +65,41 @@ def test_create_task():
     assert "created_at" in data
 
 
-def test_create_task_with_invalid_status():
+def test_create_tasks_bulk(client):
+    """Test creating several tasks in one request."""
+    response = client.post("/api/v1/tasks/bulk", json=[
+        {"title": "Bulk task 1", "priority": "high"},
+        {"title": "Bulk task 2", "status": "in-progress"},
+        {"title": "Bulk task 3", "description": "Third"}
+    ])
+    assert response.status_code == 201
+    data = response.json()
+    assert [task["title"] for task in data] == ["Bulk task 1", "Bulk task 2", "Bulk task 3"]
+    assert data[0]["priority"] == "high"
+    assert data[1]["status"] == "in-progress"
+    assert data[2]["status"] == "pending"
+    assert data[2]["priority"] == "medium"
+    assert all("id" in task and task["created_at"] for task in data)
+
+
+def test_create_tasks_bulk_invalid_item(client):
+    """Test that one invalid item rejects the whole batch."""
+    response = client.post("/api/v1/tasks/bulk", json=[
+        {"title": "Valid task"},
+        {"title": ""}
+    ])
+    assert response.status_code == 422
+
+
+def test_create_tasks_bulk_too_many(client):
+    """Test that batches over the size cap are rejected."""
+    response = client.post(
+        "/api/v1/tasks/bulk", json=[{"title": f"Task {i}"} for i in range(501)]
+    )
+    assert response.status_code == 422
+
+
+def test_create_task_with_invalid_status(client):
     """Test creating a task with invalid status."""
     response = client.post("/api/v1/tasks", json={
         "title": "Invalid task",
@@ -67,7 +108,24 @@ def test_create_task_with_invalid_status():
     assert response.status_code == 422
 
 
-def test_create_task_with_invalid_priority():
+def test_validation_error_reports_field_location(client):
+    """Test that validation errors report the field location as a list."""
+    response = client.post("/api/v1/tasks", json={"title": ""})
+    assert response.status_code == 422
+    errors = response.json()["error"]["details"]["errors"]
+    assert errors[0]["field"] == ["body", "title"]
+
+
+def test_create_task_with_unknown_field(client):
+    """Test that unknown fields are rejected."""
+    response = client.post("/api/v1/tasks", json={
+        "title": "Task with extra field",
+        "owner": "someone"
+    })
+    assert response.status_code == 422
+
+
+def test_create_task_with_invalid_priority(client):
     """Test creating a task with invalid priority."""
     response = client.post("/api/v1/tasks", json={
         "title": "Invalid task",
@@ -76,7 +134,7 @@ def test_create_task_with_invalid_priority():
     assert response.status_code == 422
 
 
-def test_create_task_empty_title():
+def test_create_task_empty_title(client):
     """Test creating a task with empty title."""
     response = client.post("/api/v1/tasks", json={
         "title": "",
@@ -85,7 +143,7 @@ def test_create_task_empty_title():
     assert response.status_code == 422
 
 
-def test_get_tasks():
+def test_get_tasks(client):
     """Test getting all tasks."""
     # Create a task first
     client.post("/api/v1/tasks", json={
@@ -100,7 +158,7 @@ def test_get_tasks():
     assert len(tasks) > 0
 
 
-def test_get_task_by_id():
+def test_get_task_by_id(client):
     """Test getting a specific task."""
     # Create a task first
     create_response = client.post("/api/v1/tasks", json={
@@ -117,13 +175,50 @@ def test_get_task_by_id():
     assert data["title"] == "Test task by ID"
 
 
-def test_get_nonexistent_task():
+def test_get_task_not_modified(client):
+    """Test conditional GET with the task's ETag."""
+    create_response = client.post("/api/v1/tasks", json={"title": "Cached task"})
+    task_id = create_response.json()["id"]
+
+    response = client.get(f"/api/v1/tasks/{task_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(
+        f"/api/v1/tasks/{task_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.get(
+        f"/api/v1/tasks/{task_id}", headers={"If-None-Match": 'W/"0-0"'}
+    )
+    assert response.status_code == 200
+
+
+def test_get_task_etag_changes_on_update(client):
+    """Test an update right after a read yields a new ETag, not a 304."""
+    create_response = client.post("/api/v1/tasks", json={"title": "Cached task"})
+    task_id = create_response.json()["id"]
+    etag = client.get(f"/api/v1/tasks/{task_id}").headers["etag"]
+
+    client.put(f"/api/v1/tasks/{task_id}", json={"status": "completed"})
+
+    response = client.get(
+        f"/api/v1/tasks/{task_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert response.headers["etag"] != etag
+
+
+def test_get_nonexistent_task(client):
     """Test getting a non-existent task."""
     response = client.get("/api/v1/tasks/99999")
     assert response.status_code == 404
 
 
-def test_update_task():
+def test_update_task(client):
     """Test updating a task."""
     # Create a task first
     create_response = client.post("/api/v1/tasks", json={
@@ -142,7 +237,7 @@ def test_update_task():
     assert data["title"] == "Original task"  # Should remain unchanged
 
 
-def test_update_task_multiple_fields():
+def test_update_task_multiple_fields(client):
     """Test updating multiple fields of a task."""
     # Create a task first
     create_response = client.post("/api/v1/tasks", json={
@@ -166,7 +261,7 @@ def test_update_task_multiple_fields():
     assert data["priority"] == "high"
 
 
-def test_update_nonexistent_task():
+def test_update_nonexistent_task(client):
     """Test updating a non-existent task."""
     response = client.put("/api/v1/tasks/99999", json={
         "status": "completed"
@@ -174,35 +269,33 @@ def test_update_nonexistent_task():
     assert response.status_code == 404
 
 
-def test_filter_tasks_by_status(multiple_tasks):
+def test_filter_tasks_by_status(task_service, multiple_tasks):
     """Test filtering tasks by status."""
-    response = client.get("/api/v1/tasks?status=completed")
-    assert response.status_code == 200
-    tasks = response.json()
+    tasks = task_service(TaskService.get_all_tasks, status=TaskStatus.COMPLETED)
+    assert sorted(task["id"] for task in tasks) == [multiple_tasks[1], multiple_tasks[3]]
     for task in tasks:
         assert task["status"] == "completed"
 
 
-def test_filter_tasks_by_priority(multiple_tasks):
+def test_filter_tasks_by_priority(task_service, multiple_tasks):
     """Test filtering tasks by priority."""
-    response = client.get("/api/v1/tasks?priority=high")
-    assert response.status_code == 200
-    tasks = response.json()
+    tasks = task_service(TaskService.get_all_tasks, priority=TaskPriority.HIGH)
+    assert sorted(task["id"] for task in tasks) == [multiple_tasks[0], multiple_tasks[3]]
     for task in tasks:
         assert task["priority"] == "high"
 
 
-def test_filter_tasks_multiple_filters(multiple_tasks):
+def test_filter_tasks_multiple_filters(task_service, multiple_tasks):
     """Test filtering tasks by multiple criteria."""
-    response = client.get("/api/v1/tasks?status=completed&priority=high")
-    assert response.status_code == 200
-    tasks = response.json()
-    for task in tasks:
-        assert task["status"] == "completed"
-        assert task["priority"] == "high"
+    tasks = task_service(
+        TaskService.get_all_tasks,
+        status=TaskStatus.COMPLETED,
+        priority=TaskPriority.HIGH
+    )
+    assert [task["id"] for task in tasks] == [multiple_tasks[3]]
 
 
-def test_search_tasks(multiple_tasks):
+def test_search_tasks(client, multiple_tasks):
     """Test searching tasks."""
     # Create a specific task for this test
     response = client.post("/api/v1/tasks", json={
@@ -232,7 +325,7 @@ def test_search_tasks(multiple_tasks):
     assert found, "Should find task by description"
 
 
-def test_pagination():
+def test_pagination(client):
     """Test task pagination."""
     # Create several tasks
     for i in range(5):
@@ -248,7 +341,34 @@ def test_pagination():
     assert len(tasks) <= 2
 
 
-def test_delete_task():
+def test_get_task_summaries(client, sample_task):
+    """Test that task summaries omit the description."""
+    response = client.get("/api/v1/tasks/summary")
+    assert response.status_code == 200
+    summaries = response.json()
+    assert len(summaries) > 0
+    summary = next(t for t in summaries if t["id"] == sample_task["id"])
+    assert "description" not in summary
+    assert summary["title"] == sample_task["title"]
+    assert summary["status"] == sample_task["status"]
+
+
+def test_get_tasks_total_count_header(client, multiple_tasks):
+    """Test that the list endpoint reports the unpaginated total."""
+    count = client.get("/api/v1/tasks/count?status=completed").json()["total"]
+
+    response = client.get("/api/v1/tasks?status=completed&limit=1")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert int(response.headers["X-Total-Count"]) == count
+
+    # A page past the end still reports the total
+    response = client.get(f"/api/v1/tasks?status=completed&skip={count}")
+    assert response.json() == []
+    assert int(response.headers["X-Total-Count"]) == count
+
+
+def test_delete_task(client):
     """Test deleting a task."""
     # Create a task first
     create_response = client.post("/api/v1/tasks", json={
@@ -266,13 +386,13 @@ def test_delete_task():
     assert response.status_code == 404
 
 
-def test_delete_nonexistent_task():
+def test_delete_nonexistent_task(client):
     """Test deleting a non-existent task."""
     response = client.delete("/api/v1/tasks/99999")
     assert response.status_code == 404
 
 
-def test_get_task_count():
+def test_get_task_count(client):
     """Test getting task count."""
     # Create a few tasks
     client.post("/api/v1/tasks", json={"title": "Count task 1"})
@@ -285,7 +405,7 @@ def test_get_task_count():
     assert data["total"] >= 2
 
 
-def test_get_status_list():
+def test_get_status_list(client):
     """Test getting available statuses."""
     response = client.get("/api/v1/tasks/status/list")
     assert response.status_code == 200
@@ -296,7 +416,7 @@ def test_get_status_list():
     assert "completed" in data["statuses"]
 
 
-def test_get_priority_list():
+def test_get_priority_list(client):
     """Test getting available priorities."""
     response = client.get("/api/v1/tasks/priority/list")
     assert response.status_code == 200
@@ -307,7 +427,7 @@ def test_get_priority_list():
     assert "high" in data["priorities"]
 
 
-def test_task_timestamps():
+def test_task_timestamps(client):
     """Test that tasks have proper timestamps."""
     response = client.post("/api/v1/tasks", json={
         "title": "Timestamp test",
@@ -329,7 +449,7 @@ def test_task_timestamps():
     assert updated_data["updated_at"] is not None
 
 
-def test_default_values():
+def test_default_values(client):
     """Test default values for status and priority."""
     response = client.post("/api/v1/tasks", json={
         "title": "Default test"
@@ -337,4 +457,170 @@ def test_default_values():
     assert response.status_code == 201
     data = response.json()
     assert data["status"] == "pending"
-    assert data["priority"] == "medium"
\ No newline at end of file
+    assert data["priority"] == "medium"
+
+
+def test_improved_get_task_cached(improved_client, db_session, redis_cache):
+    """Test a task read is cached until a write invalidates it."""
+    task_id = improved_client.post(
+        f"{IMPROVED_PREFIX}/", json={"title": "Cached task"}
+    ).json()["id"]
+
+    # Miss: read from the database and stored
+    response = improved_client.get(f"{IMPROVED_PREFIX}/{task_id}")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Cached task"
+    assert any(key.endswith(f":task:{task_id}") for key in redis_cache.store)
+    etag = response.headers["etag"]
+
+    # Hit: the stored body is served even after the row changes underneath
+    async def rename():
+        await db_session.execute(
+            update(Task).where(Task.id == task_id).values(title="Renamed task")
+        )
+
+    improved_client.portal.call(rename)
+    response = improved_client.get(f"{IMPROVED_PREFIX}/{task_id}")
+    assert response.json()["title"] == "Cached task"
+    assert response.headers["etag"] == etag
+
+    # A write bumps the cache version, so the next read misses again
+    improved_client.put(f"{IMPROVED_PREFIX}/{task_id}", json={"title": "Updated task"})
+    response = improved_client.get(f"{IMPROVED_PREFIX}/{task_id}")
+    assert response.json()["title"] == "Updated task"
+
+
+def test_improved_get_task_not_cached_when_missing(improved_client, db_session, redis_cache):
+    """Test a 404 is not stored in the cache."""
+    response = improved_client.get(f"{IMPROVED_PREFIX}/99999")
+    assert response.status_code == 404
+    assert not any(key.endswith(":task:99999") for key in redis_cache.store)
+
+
+def test_improved_list_cached(improved_client, db_session, redis_cache, multiple_tasks):
+    """Test list responses are cached per filter set and invalidated on writes."""
+    url = f"{IMPROVED_PREFIX}/?status=completed"
+    first = improved_client.get(url)
+    assert sorted(task["id"] for task in first.json()) == [multiple_tasks[1], multiple_tasks[3]]
+
+    # Rows inserted without going through the service do not invalidate
+    insert_tasks(improved_client, db_session, [
+        {"title": "Task 5", "status": "completed", "priority": "low"}
+    ])
+    assert improved_client.get(url).content == first.content
+
+    # A different filter set is a different key, so it is a miss
+    response = improved_client.get(f"{IMPROVED_PREFIX}/?status=completed&priority=low")
+    assert [task["title"] for task in response.json()] == ["Task 5"]
+
+    # Creating a task through the API invalidates every cached list
+    improved_client.post(
+        f"{IMPROVED_PREFIX}/", json={"title": "Task 6", "status": "completed"}
+    )
+    titles = {task["title"] for task in improved_client.get(url).json()}
+    assert titles == {"Task 2", "Task 4", "Task 5", "Task 6"}
+
+
+def fetch_all_cursor_pages(client, limit):
+    """Follow next_cursor from the first page to the last; return the pages."""
+    pages = []
+    params = {"limit": limit}
+    while True:
+        response = client.get(f"{IMPROVED_PREFIX}/cursor", params=params)
+        assert response.status_code == 200
+        pages.append(response.json())
+        if pages[-1]["next_cursor"] is None:
+            return pages
+        params["cursor"] = pages[-1]["next_cursor"]
+
+
+def test_cursor_pagination_to_end(improved_client, db_session):
+    """Test cursor pages cover every task newest first, ending with a null cursor."""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    ids = insert_tasks(improved_client, db_session, [
+        {"title": f"Task {i}", "created_at": start + timedelta(minutes=i)}
+        for i in range(5)
+    ])
+
+    pages = fetch_all_cursor_pages(improved_client, limit=2)
+    assert [len(page["items"]) for page in pages] == [2, 2, 1]
+    assert [task["id"] for page in pages for task in page["items"]] == ids[::-1]
+
+
+def test_cursor_pagination_exact_last_page(improved_client, db_session):
+    """Test a last page that is exactly full still has a null cursor."""
+    insert_tasks(improved_client, db_session, [
+        {"title": f"Task {i}"} for i in range(4)
+    ])
+
+    pages = fetch_all_cursor_pages(improved_client, limit=2)
+    assert [len(page["items"]) for page in pages] == [2, 2]
+
+
+def test_cursor_pagination_created_at_ties(improved_client, db_session):
+    """Test tasks sharing a created_at are split across pages by id."""
+    created_at = datetime(2024, 1, 1, 12, 0, 0)
+    ids = insert_tasks(improved_client, db_session, [
+        {"title": f"Task {i}", "created_at": created_at} for i in range(5)
+    ])
+
+    pages = fetch_all_cursor_pages(improved_client, limit=2)
+    assert [task["id"] for page in pages for task in page["items"]] == ids[::-1]
+
+
+def test_cursor_pagination_malformed_cursor(improved_client, db_session):
+    """Test a cursor that does not decode is rejected with a 422."""
+    for cursor in ["not-a-cursor", "!!!", "WzFd"]:
+        response = improved_client.get(
+            f"{IMPROVED_PREFIX}/cursor", params={"cursor": cursor}
+        )
+        assert response.status_code == 422
+
+
+def test_improved_list_streams_large_pages(improved_client, db_session, task_service):
+    """Test a page over the streaming threshold matches get_all_tasks."""
+    insert_tasks(improved_client, db_session, [
+        {"title": f"Task {i}", "description": f"Description {i}"} for i in range(150)
+    ])
+
+    response = improved_client.get(f"{IMPROVED_PREFIX}/", params={"limit": 120})
+    assert response.status_code == 200
+    expected = task_service(TaskService.get_all_tasks, limit=120)
+    assert len(expected) == 120
+    assert response.json() == jsonable_encoder([dict(row) for row in expected])
+
+
+def test_improved_list_streams_empty_page(improved_client, db_session, task_service):
+    """Test a streamed page with no matches is an empty JSON array."""
+    params = {"limit": 120, "search": "no such task"}
+    response = improved_client.get(f"{IMPROVED_PREFIX}/", params=params)
+    assert response.status_code == 200
+    assert response.content == b"[]"
+    assert task_service(TaskService.get_all_tasks, limit=120, search="no such task") == []
+
+
+def test_get_full_stats(app_client, db_session, task_service):
+    """Test stats filter only the total and zero-fill the breakdowns."""
+    insert_tasks(app_client, db_session, [
+        {"title": "Write report", "status": "pending", "priority": "high"},
+        {"title": "Send report", "status": "completed", "priority": "high"},
+        {"title": "File taxes", "status": "completed", "priority": "low"},
+    ])
+    by_status = {"pending": 1, "in-progress": 0, "completed": 2}
+    by_priority = {"low": 1, "medium": 0, "high": 2}
+
+    stats = task_service(TaskService.get_full_stats)
+    assert stats == {"total": 3, "by_status": by_status, "by_priority": by_priority}
+
+    stats = task_service(
+        TaskService.get_full_stats,
+        status=TaskStatus.COMPLETED,
+        priority=TaskPriority.HIGH
+    )
+    assert stats == {"total": 1, "by_status": by_status, "by_priority": by_priority}
+
+    stats = task_service(TaskService.get_full_stats, search="report")
+    assert stats["total"] == 2
+
+    stats = task_service(TaskService.get_full_stats, status=TaskStatus.IN_PROGRESS)
+    assert stats["total"] == 0
@@ -0,0 +1,72 @@
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import Base, engine
+from app.models import task  # noqa: F401  (registers the tables on Base)
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _include_object_for(dialect_name: str):
+    """
+    Build an autogenerate filter for the target database's dialect
+
+    The trigram and full-text GIN indexes are declared with
+    ddl_if(dialect="postgresql"), which create_all honours but autogenerate
+    does not. On any other database they would show up as missing on every
+    comparison, so indexes with a postgresql_using method are left out there.
+    Against PostgreSQL everything is compared.
+    """
+    def include_object(obj, name, type_, reflected, compare_to):
+        if type_ == "index" and not reflected and dialect_name != "postgresql":
+            return not obj.dialect_options["postgresql"]["using"]
+        return True
+
+    return include_object
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to the database"""
+    context.configure(
+        url=engine.url.render_as_string(hide_password=False),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=engine.dialect.name == "sqlite",
+        include_object=_include_object_for(engine.dialect.name)
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        include_object=_include_object_for(connection.dialect.name)
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Run the migrations against the application's (async) database"""
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
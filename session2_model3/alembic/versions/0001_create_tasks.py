@@ -0,0 +1,78 @@
+"""Create tasks and task_dependencies
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Enum columns store the member names, as Enum(TaskStatus) does
+task_status = sa.Enum(
+    "PENDING", "IN_PROGRESS", "COMPLETED", "CANCELLED", "ON_HOLD", name="taskstatus"
+)
+task_priority = sa.Enum("LOW", "MEDIUM", "HIGH", "CRITICAL", name="taskpriority")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("status", task_status, nullable=False),
+        sa.Column("priority", task_priority, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("assigned_to", sa.String(length=100), nullable=True),
+        sa.Column("estimated_hours", sa.Integer(), nullable=True),
+        sa.Column("actual_hours", sa.Integer(), nullable=True),
+        sa.Column("tags", sa.String(length=500), nullable=True),
+        sa.PrimaryKeyConstraint("id")
+    )
+    op.create_index("ix_tasks_id", "tasks", ["id"])
+    op.create_index("ix_tasks_title", "tasks", ["title"])
+    op.create_index("ix_tasks_assigned_to", "tasks", ["assigned_to"])
+    op.create_index("ix_tasks_created_id", "tasks", ["created_at", "id"])
+    op.create_index(
+        "ix_tasks_status_priority_created", "tasks", ["status", "priority", "created_at", "id"]
+    )
+    op.create_index("ix_tasks_priority_created", "tasks", ["priority", "created_at", "id"])
+
+    op.create_table(
+        "task_dependencies",
+        sa.Column("parent_id", sa.Integer(), nullable=False),
+        sa.Column("child_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["parent_id"], ["tasks.id"]),
+        sa.ForeignKeyConstraint(["child_id"], ["tasks.id"]),
+        sa.PrimaryKeyConstraint("parent_id", "child_id")
+    )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for column in ("title", "description", "assigned_to"):
+            op.create_index(
+                f"ix_tasks_{column}_trgm", "tasks", [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"}
+            )
+        op.create_index(
+            "ix_tasks_search_fts", "tasks",
+            [sa.text("to_tsvector('english', (title || ' ') || coalesce(description, ''))")],
+            postgresql_using="gin"
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("task_dependencies")
+    op.drop_table("tasks")
+    if op.get_bind().dialect.name == "postgresql":
+        task_priority.drop(op.get_bind(), checkfirst=True)
+        task_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,28 @@
+"""Index the due-date filters and tag search
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_status_due", "tasks", ["status", "due_date"])
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_tasks_tags_trgm", "tasks", ["tags"],
+            postgresql_using="gin",
+            postgresql_ops={"tags": "gin_trgm_ops"}
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_tasks_tags_trgm", table_name="tasks")
+    op.drop_index("ix_tasks_status_due", table_name="tasks")
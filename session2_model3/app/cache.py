@@ -0,0 +1,36 @@
+"""
+Short-lived in-process cache for the aggregate task endpoints
+
+Entries expire after CACHE_TTL_SECONDS, and every write through the API
+clears the cache. Each worker process keeps its own cache, so a write
+handled by another worker is seen here once the TTL runs out.
+"""
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+
+_entries: Dict[str, Tuple[float, Any]] = {}
+
+
+def get(key: str) -> Optional[Any]:
+    """Return the cached value for key, or None if missing or expired"""
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _entries[key]
+        return None
+    return value
+
+
+def set(key: str, value: Any) -> None:
+    """Cache value under key for CACHE_TTL_SECONDS"""
+    _entries[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+
+
+def invalidate() -> None:
+    """Drop every cached value (after any write to the tasks)"""
+    _entries.clear()
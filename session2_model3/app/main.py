@@ -1,6 +1,4 @@
 from fastapi import FastAPI
-from .database import engine
-from .models.task import Base
 from .routers.tasks import router as tasks_router
 
 app = FastAPI(
@@ -14,10 +12,7 @@ app = FastAPI(
 # Include routers
 app.include_router(tasks_router)
 
-# Create database tables
-@app.on_event("startup")
-def on_startup():
-    Base.metadata.create_all(bind=engine)
+# The schema is managed by Alembic (`alembic upgrade head`), not at startup
 
 
 @app.get("/health", tags=["health"])
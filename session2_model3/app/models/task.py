@@ -1,11 +1,24 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Text, Table, ForeignKey
+from sqlalchemy import (
+    Column, Integer, String, DateTime, Enum, Text, Table, ForeignKey, Index, DDL,
+    case, event, literal_column, text
+)
+from sqlalchemy.dialects.sqlite import DATETIME as SQLITE_DATETIME
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum as PyEnum
-from typing import Dict, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
 from ..database import Base
 
 
+# SQLite's CURRENT_TIMESTAMP stores whole seconds as text. Bind datetimes in
+# the same form so keyset cursors compare equal to the stored values.
+_SQLITE_TIMESTAMP = SQLITE_DATETIME(
+    storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+)
+
+
 class TaskStatus(PyEnum):
     PENDING = "pending"
     IN_PROGRESS = "in-progress"
@@ -21,6 +34,49 @@ class TaskPriority(PyEnum):
     CRITICAL = "critical"
 
 
+# Allowed status transitions, keyed by current status (read-only)
+ALLOWED_TRANSITIONS: Mapping[TaskStatus, FrozenSet[TaskStatus]] = MappingProxyType({
+    TaskStatus.PENDING: frozenset({TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED, TaskStatus.ON_HOLD}),
+    TaskStatus.IN_PROGRESS: frozenset({TaskStatus.COMPLETED, TaskStatus.ON_HOLD, TaskStatus.CANCELLED}),
+    TaskStatus.ON_HOLD: frozenset({TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED}),
+    TaskStatus.COMPLETED: frozenset({TaskStatus.IN_PROGRESS}),  # Allow reopening
+    TaskStatus.CANCELLED: frozenset({TaskStatus.PENDING})  # Allow reopening
+})
+
+# Derived once from ALLOWED_TRANSITIONS, in TaskStatus declaration order:
+# the allowed targets as display text, and the statuses each status can
+# be reached from
+ALLOWED_TRANSITIONS_TEXT: Mapping[TaskStatus, str] = MappingProxyType({
+    status: ", ".join(target.value for target in TaskStatus if target in targets)
+    for status, targets in ALLOWED_TRANSITIONS.items()
+})
+_STATUSES_ALLOWING: Mapping[TaskStatus, Tuple[TaskStatus, ...]] = MappingProxyType({
+    new_status: tuple(
+        status for status in TaskStatus if new_status in ALLOWED_TRANSITIONS[status]
+    )
+    for new_status in TaskStatus
+})
+
+
+# Progress percentage reported for each status
+PROGRESS_BY_STATUS: Dict[TaskStatus, float] = {
+    TaskStatus.PENDING: 0.0,
+    TaskStatus.IN_PROGRESS: 50.0,
+    TaskStatus.COMPLETED: 100.0,
+    TaskStatus.ON_HOLD: 25.0,
+    TaskStatus.CANCELLED: 0.0
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_tags(tags: str) -> Tuple[str, ...]:
+    """
+    Parse a stored tags string once; tag sets repeat across rows, so list
+    responses mostly hit the cache
+    """
+    return tuple(tag.strip() for tag in tags.split(',') if tag.strip())
+
+
 # Association table for many-to-many relationship between tasks (dependencies)
 task_dependencies = Table(
     'task_dependencies',
@@ -32,14 +88,62 @@ task_dependencies = Table(
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at, id in either direction
+        Index("ix_tasks_created_id", "created_at", "id"),
+        # status (and optionally priority) equality filters plus the default
+        # created_at ordering, answered by one range scan with no sort step;
+        # also covers status-only lookups through its leading column
+        Index("ix_tasks_status_priority_created", "status", "priority", "created_at", "id"),
+        # Same for priority-only filters
+        Index("ix_tasks_priority_created", "priority", "created_at", "id"),
+        # due_soon/overdue: open statuses plus a due_date range
+        Index("ix_tasks_status_due", "status", "due_date"),
+        # PostgreSQL only: trigram GIN indexes serve the unanchored
+        # ILIKE '%term%' search instead of a sequential scan
+        Index(
+            "ix_tasks_title_trgm", "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tasks_description_trgm", "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tasks_assigned_to_trgm", "assigned_to",
+            postgresql_using="gin",
+            postgresql_ops={"assigned_to": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tasks_tags_trgm", "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        # Full-text index for multi-word searches; the expression must stay
+        # identical to search_document() for the planner to use it
+        Index(
+            "ix_tasks_search_fts",
+            text("to_tsvector('english', (title || ' ') || coalesce(description, ''))"),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True)
-    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
+    priority = Column(Enum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True).with_variant(_SQLITE_TIMESTAMP, "sqlite"),
+        server_default=func.now(),
+        nullable=False
+    )
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Incremented by every UPDATE; unlike updated_at it changes even for
+    # writes within the same second, so it backs the task's ETag
+    version = Column(Integer, default=1, server_default="1", nullable=False)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     due_date = Column(DateTime(timezone=True), nullable=True)
     assigned_to = Column(String(100), nullable=True, index=True)
@@ -47,13 +151,15 @@ class Task(Base):
     actual_hours = Column(Integer, nullable=True)
     tags = Column(String(500), nullable=True)  # Comma-separated tags
 
-    # Relationships
+    # Relationships raise instead of lazy-loading; queries that need them
+    # eager-load explicitly (selectinload)
     dependencies = relationship(
         "Task",
         secondary=task_dependencies,
         primaryjoin="Task.id == task_dependencies.c.parent_id",
         secondaryjoin="Task.id == task_dependencies.c.child_id",
-        back_populates="dependents"
+        back_populates="dependents",
+        lazy="raise"
     )
 
     dependents = relationship(
@@ -61,7 +167,8 @@ class Task(Base):
         secondary=task_dependencies,
         primaryjoin="Task.id == task_dependencies.c.child_id",
         secondaryjoin="Task.id == task_dependencies.c.parent_id",
-        back_populates="dependencies"
+        back_populates="dependencies",
+        lazy="raise"
     )
 
     def __repr__(self):
@@ -70,8 +177,13 @@ class Task(Base):
     @property
     def tags_list(self) -> list:
         """Return tags as a list"""
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        return Task.split_tags(self.tags)
+
+    @staticmethod
+    def split_tags(tags: Optional[str]) -> list:
+        """Split a stored comma-separated tags string into a list"""
+        if tags:
+            return list(_parse_tags(tags))
         return []
 
     @tags_list.setter
@@ -81,18 +193,16 @@ class Task(Base):
 
     def can_transition_to(self, new_status: TaskStatus) -> bool:
         """Check if status transition is allowed"""
-        transitions = self.get_allowed_transitions()
-        return new_status in transitions.get(self.status, set())
+        return new_status in ALLOWED_TRANSITIONS.get(self.status, frozenset())
 
-    def get_allowed_transitions(self) -> Dict[TaskStatus, Set[TaskStatus]]:
+    def get_allowed_transitions(self) -> Mapping[TaskStatus, FrozenSet[TaskStatus]]:
         """Get allowed status transitions"""
-        return {
-            TaskStatus.PENDING: {TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED, TaskStatus.ON_HOLD},
-            TaskStatus.IN_PROGRESS: {TaskStatus.COMPLETED, TaskStatus.ON_HOLD, TaskStatus.CANCELLED},
-            TaskStatus.ON_HOLD: {TaskStatus.PENDING, TaskStatus.IN_PROGRESS, TaskStatus.CANCELLED},
-            TaskStatus.COMPLETED: {TaskStatus.IN_PROGRESS},  # Allow reopening
-            TaskStatus.CANCELLED: {TaskStatus.PENDING}  # Allow reopening
-        }
+        return ALLOWED_TRANSITIONS
+
+    @staticmethod
+    def statuses_allowing(new_status: TaskStatus) -> Tuple[TaskStatus, ...]:
+        """Get the statuses a task may move to new_status from"""
+        return _STATUSES_ALLOWING[new_status]
 
     def get_blocking_dependencies(self) -> list:
         """Get dependencies that block this task"""
@@ -108,11 +218,33 @@ class Task(Base):
 
     def get_progress_percentage(self) -> float:
         """Calculate progress percentage based on status"""
-        status_progress = {
-            TaskStatus.PENDING: 0.0,
-            TaskStatus.IN_PROGRESS: 50.0,
-            TaskStatus.COMPLETED: 100.0,
-            TaskStatus.ON_HOLD: 25.0,
-            TaskStatus.CANCELLED: 0.0
-        }
-        return status_progress.get(self.status, 0.0)
\ No newline at end of file
+        return PROGRESS_BY_STATUS.get(self.status, 0.0)
+
+
+def progress_percentage():
+    """SQL form of Task.get_progress_percentage, computed in the SELECT"""
+    return case(
+        *[(Task.status == status, progress) for status, progress in PROGRESS_BY_STATUS.items()],
+        else_=0.0
+    )
+
+
+def search_document():
+    """
+    Full-text document over title and description (PostgreSQL).
+
+    Built from literals rather than bound parameters, so it compiles to the
+    ix_tasks_search_fts index expression exactly.
+    """
+    document = Task.title.op("||")(literal_column("' '")).op("||")(
+        func.coalesce(Task.description, literal_column("''"))
+    )
+    return func.to_tsvector(literal_column("'english'"), document)
+
+
+# The trigram operator classes come from the pg_trgm extension
+event.listen(
+    Task.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
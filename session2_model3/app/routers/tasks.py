@@ -1,106 +1,338 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, func, desc
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, raiseload, selectinload
+from sqlalchemy import (
+    and_, or_, bindparam, func, desc, delete, exists, extract, insert, literal, literal_column,
+    select, text, tuple_, update
+)
+from typing import Dict, List, Optional, Tuple
+from pydantic import ValidationError
 from datetime import datetime, timedelta
+import base64
+import binascii
+import hashlib
 import logging
+import orjson
+import re
 
+from .. import cache
 from ..database import get_db
 from ..models.task import (
     Task, TaskStatus as TaskStatusEnum, TaskPriority as TaskPriorityEnum,
-    task_dependencies
+    task_dependencies, search_document, progress_percentage, ALLOWED_TRANSITIONS_TEXT
 )
 from ..schemas.task import (
     TaskCreate, TaskUpdate, TaskResponse, TaskStatus, TaskPriority,
-    BulkTaskUpdate, TaskStatusTransition, TaskStatistics, TaskDependency
+    BulkTaskUpdate, TaskStatusTransition, TaskStatistics, TaskBatchRequest, BatchResult
 )
 
 router = APIRouter(prefix="/api/v1/tasks", tags=["tasks"])
 logger = logging.getLogger(__name__)
 
 
-def _convert_task_to_response(task: Task, db: Session) -> TaskResponse:
-    """Helper function to convert Task model to TaskResponse"""
-    dependencies = [
-        TaskDependency(
-            id=dep.id,
-            title=dep.title,
-            status=TaskStatus(dep.status.value)
-        )
+def _static_json(payload: dict) -> Tuple[bytes, dict]:
+    """Encode an immutable payload once, with its caching headers"""
+    body = orjson.dumps(payload)
+    headers = {
+        "Cache-Control": "public, max-age=86400",
+        "ETag": f'"{hashlib.sha1(body).hexdigest()}"'
+    }
+    return body, headers
+
+
+# Schema enum (or raw value) -> model enum. The schema enums are str enums,
+# so their members hash like their values and a dict lookup replaces an
+# Enum() call.
+_STATUS_MAP = {status.value: status for status in TaskStatusEnum}
+_PRIORITY_MAP = {priority.value: priority for priority in TaskPriorityEnum}
+
+# The enum listings never change at runtime, so their bodies are built once
+_STATUSES_JSON, _STATUSES_HEADERS = _static_json(
+    {"statuses": [status.value for status in TaskStatusEnum]}
+)
+_PRIORITIES_JSON, _PRIORITIES_HEADERS = _static_json(
+    {"priorities": [priority.value for priority in TaskPriorityEnum]}
+)
+
+
+# Shortest search term accepted by the list endpoint
+_MIN_SEARCH_LENGTH = 2
+
+# Sub-request paths accepted by the batch endpoint, with or without the
+# router prefix
+_BATCH_URL = re.compile(r"^(?:/api/v1)?/tasks(?:/(?P<task_id>\d+))?/?$")
+
+
+# Columns read by the list endpoint, which never builds Task instances
+_TASK_COLUMNS = (
+    Task.id, Task.title, Task.description, Task.status, Task.priority,
+    Task.created_at, Task.updated_at, Task.completed_at, Task.due_date,
+    Task.assigned_to, Task.estimated_hours, Task.actual_hours, Task.tags,
+    progress_percentage().label("progress_percentage")
+)
+
+
+def _row_to_dict(row, dependencies: List[dict], progress: float) -> dict:
+    """
+    Plain-dict form of a task, in TaskResponse's shape
+
+    row may be a Task or a row of _TASK_COLUMNS; dependencies are the
+    already-serialized dependency dicts.
+    """
+    return {
+        "id": row.id,
+        "title": row.title,
+        "description": row.description,
+        "status": row.status.value,
+        "priority": row.priority.value,
+        "created_at": row.created_at,
+        "updated_at": row.updated_at,
+        "completed_at": row.completed_at,
+        "due_date": row.due_date,
+        "assigned_to": row.assigned_to,
+        "estimated_hours": row.estimated_hours,
+        "actual_hours": row.actual_hours,
+        "tags": Task.split_tags(row.tags),
+        "progress_percentage": progress,
+        "is_ready_to_start": all(
+            dep["status"] == TaskStatusEnum.COMPLETED.value for dep in dependencies
+        ),
+        "dependencies": dependencies
+    }
+
+
+def _task_to_dict(task: Task) -> dict:
+    """Plain-dict form of a Task instance, in TaskResponse's shape"""
+    return _row_to_dict(task, [
+        {"id": dep.id, "title": dep.title, "status": dep.status.value}
         for dep in task.dependencies
-    ]
-
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=TaskStatus(task.status.value),
-        priority=TaskPriority(task.priority.value),
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        due_date=task.due_date,
-        assigned_to=task.assigned_to,
-        estimated_hours=task.estimated_hours,
-        actual_hours=task.actual_hours,
-        tags=task.tags_list,
-        progress_percentage=task.get_progress_percentage(),
-        is_ready_to_start=task.is_ready_to_start(),
-        dependencies=dependencies
+    ], task.get_progress_percentage())
+
+
+async def _load_dependencies(db: AsyncSession, task_ids: List[int]) -> Dict[int, List[dict]]:
+    """Fetch the dependencies of several tasks in one query, keyed by task id"""
+    dependencies = {}
+    if not task_ids:
+        return dependencies
+
+    rows = (await db.execute(
+        select(task_dependencies.c.parent_id, Task.id, Task.title, Task.status)
+        .join(task_dependencies, task_dependencies.c.child_id == Task.id)
+        .where(task_dependencies.c.parent_id.in_(task_ids))
+    )).all()
+    for parent_id, dep_id, title, status in rows:
+        dependencies.setdefault(parent_id, []).append(
+            {"id": dep_id, "title": title, "status": status.value}
+        )
+    return dependencies
+
+
+def _task_json_response(task: Task) -> Response:
+    """Serialize a single task straight to JSON with orjson"""
+    return Response(
+        content=orjson.dumps(_task_to_dict(task)), media_type="application/json"
     )
 
 
-@router.post("/", response_model=TaskResponse, status_code=201)
-def create_task(task: TaskCreate, db: Session = Depends(get_db)):
-    """Create a new task with optional dependencies"""
+def _hours_between(db: AsyncSession, start, end):
+    """SQL expression for the hours elapsed from start to end"""
+    if db.bind.dialect.name == "postgresql":
+        return extract("epoch", end - start) / 3600.0
+    return (func.julianday(end) - func.julianday(start)) * 24.0
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip() for tag in if_none_match.split(",")
+    )
+
+
+async def _task_etag(db: AsyncSession, task_id: int) -> Optional[str]:
+    """
+    Weak ETag for a task's response, or None if the task does not exist
+
+    The response embeds each dependency's status, so the tag combines the
+    task's version with the sum of its dependencies' versions. Dependency
+    links are fixed at creation and versions only grow, so the sum changes
+    whenever a dependency is written. Only versions are read; no task row
+    is loaded.
+    """
+    dependency = aliased(Task)
+    version = (await db.execute(
+        select(Task.version, func.coalesce(func.sum(dependency.version), 0))
+        .outerjoin(task_dependencies, task_dependencies.c.parent_id == Task.id)
+        .outerjoin(dependency, dependency.id == task_dependencies.c.child_id)
+        .where(Task.id == task_id)
+        .group_by(Task.id)
+    )).first()
+    if version is None:
+        return None
+
+    own, dependencies = version
+    return f'W/"{task_id}-{own}-{dependencies}"'
+
+
+def _encode_cursor(task: Task) -> str:
+    """Encode a task's (created_at, id) keyset position as an opaque cursor"""
+    raw = orjson.dumps([task.created_at.isoformat(), task.id])
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor"""
     try:
-        # Validate dependencies exist
-        if task.dependency_ids:
-            existing_deps = db.query(Task).filter(Task.id.in_(task.dependency_ids)).all()
-            if len(existing_deps) != len(task.dependency_ids):
-                raise HTTPException(
-                    status_code=400,
-                    detail="One or more dependency tasks not found"
-                )
+        created_at, task_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _insert_task(db: AsyncSession, task: TaskCreate) -> dict:
+    """
+    Insert a task and its dependency links without committing
+
+    Returns the new task in TaskResponse's shape; raises a 400 if any
+    dependency does not exist.
+    """
+    # Validate dependencies exist, reading only the fields the response
+    # embeds rather than whole Task objects
+    dependencies = []
+    if task.dependency_ids:
+        dependencies = [
+            {"id": dep_id, "title": title, "status": status.value}
+            for dep_id, title, status in (await db.execute(
+                select(Task.id, Task.title, Task.status)
+                .where(Task.id.in_(task.dependency_ids))
+            )).all()
+        ]
+        if len(dependencies) != len(task.dependency_ids):
+            raise HTTPException(
+                status_code=400,
+                detail="One or more dependency tasks not found"
+            )
 
-        db_task = Task(
+    # INSERT ... RETURNING hands back the id and server-side timestamps,
+    # so no refresh SELECT is needed
+    created = (await db.execute(
+        insert(Task).values(
             title=task.title,
             description=task.description,
-            status=TaskStatusEnum(task.status),
-            priority=TaskPriorityEnum(task.priority),
+            status=_STATUS_MAP[task.status],
+            priority=_PRIORITY_MAP[task.priority],
             due_date=task.due_date,
             assigned_to=task.assigned_to,
             estimated_hours=task.estimated_hours,
-            tags_list=task.tags or []
+            tags=', '.join(task.tags) if task.tags else None
+        ).returning(*_TASK_COLUMNS)
+    )).one()
+
+    # Add all dependency links in one executemany
+    if task.dependency_ids:
+        await db.execute(
+            task_dependencies.insert(),
+            [
+                {"parent_id": created.id, "child_id": dep_id}
+                for dep_id in task.dependency_ids
+            ]
         )
 
-        db.add(db_task)
-        db.flush()  # Get the ID without committing
+    return _row_to_dict(created, dependencies, created.progress_percentage)
 
-        # Add dependencies
-        if task.dependency_ids:
-            for dep_id in task.dependency_ids:
-                db.execute(
-                    task_dependencies.insert().values(
-                        parent_id=db_task.id,
-                        child_id=dep_id
-                    )
-                )
 
-        db.commit()
-        db.refresh(db_task)
-        return _convert_task_to_response(db_task, db)
+@router.post("/", response_model=TaskResponse, status_code=201)
+async def create_task(task: TaskCreate, db: AsyncSession = Depends(get_db)):
+    """Create a new task with optional dependencies"""
+    try:
+        response = Response(
+            content=orjson.dumps(await _insert_task(db, task)),
+            status_code=201,
+            media_type="application/json"
+        )
+        await db.commit()
+        cache.invalidate()
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error creating task: {str(e)}")
-        db.rollback()
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/batch", response_model=List[BatchResult])
+async def batch_tasks(batch: TaskBatchRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Run several task reads and creates in one request
+
+    Supports GET /tasks/{id} and POST /tasks. Creates run first, in order,
+    in one transaction; all reads are then served by a single query, so
+    they also see tasks created earlier in the batch. Each result carries
+    the status and body the standalone request would have returned.
+    """
+    try:
+        results: List[Optional[dict]] = [None] * len(batch.requests)
+        reads: Dict[int, List[int]] = {}
+        created = False
+
+        for index, operation in enumerate(batch.requests):
+            match = _BATCH_URL.match(operation.url)
+            if match is None or (operation.method == "GET") != bool(match["task_id"]):
+                results[index] = {
+                    "status": 400,
+                    "body": {"detail": f"Unsupported batch request: {operation.method} {operation.url}"}
+                }
+            elif operation.method == "GET":
+                reads.setdefault(int(match["task_id"]), []).append(index)
+            else:
+                try:
+                    task = TaskCreate.model_validate(operation.body or {})
+                    results[index] = {"status": 201, "body": await _insert_task(db, task)}
+                    created = True
+                except ValidationError as e:
+                    results[index] = {
+                        "status": 422,
+                        "body": {"detail": e.errors(include_url=False, include_context=False)}
+                    }
+                except HTTPException as e:
+                    results[index] = {"status": e.status_code, "body": {"detail": e.detail}}
+
+        if reads:
+            rows = (await db.execute(
+                select(*_TASK_COLUMNS).where(Task.id.in_(reads))
+            )).all()
+            dependencies = await _load_dependencies(db, [row.id for row in rows])
+            found = {
+                row.id: _row_to_dict(row, dependencies.get(row.id, []), row.progress_percentage)
+                for row in rows
+            }
+            for task_id, indexes in reads.items():
+                result = (
+                    {"status": 200, "body": found[task_id]} if task_id in found
+                    else {"status": 404, "body": {"detail": f"Task with ID {task_id} not found"}}
+                )
+                for index in indexes:
+                    results[index] = result
+
+        body = orjson.dumps(results)
+        if created:
+            await db.commit()
+            cache.invalidate()
+        return Response(content=body, media_type="application/json")
+
+    except Exception as e:
+        logger.error(f"Error running task batch: {str(e)}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/", response_model=List[TaskResponse])
-def get_tasks(
+async def get_tasks(
+    request: Request,
     status: Optional[TaskStatus] = Query(None, description="Filter by status"),
     priority: Optional[TaskPriority] = Query(None, description="Filter by priority"),
     assigned_to: Optional[str] = Query(None, description="Filter by assignee"),
@@ -108,38 +340,76 @@ def get_tasks(
     search: Optional[str] = Query(None, description="Search tasks by title or description"),
     due_soon: Optional[bool] = Query(False, description="Filter tasks due within 7 days"),
     overdue: Optional[bool] = Query(False, description="Filter overdue tasks"),
-    skip: Optional[int] = Query(0, ge=0, description="Number of tasks to skip"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    skip: Optional[int] = Query(
+        0, ge=0, deprecated=True,
+        description="Number of tasks to skip (deprecated: use cursor)"
+    ),
     limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of tasks to return"),
     sort_by: Optional[str] = Query("created_at", description="Sort field"),
     sort_desc: Optional[bool] = Query(True, description="Sort descending"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get all tasks with comprehensive filtering, searching, and sorting"""
+    """
+    Get all tasks with comprehensive filtering, searching, and sorting
+
+    When sorting by created_at, a full page carries an X-Next-Cursor header;
+    pass it back as `cursor` to fetch the next page with an index range scan
+    instead of an OFFSET.
+
+    The page's ETag is a hash of its body; a matching If-None-Match gets an
+    empty 304.
+    """
     try:
-        query = db.query(Task).options(joinedload(Task.dependencies))
+        # Plain column rows: no Task instances or identity-map bookkeeping.
+        # Dependencies for the whole page come from one extra IN query.
+        query = select(*_TASK_COLUMNS)
 
         # Apply filters
         if status:
-            query = query.filter(Task.status == TaskStatusEnum(status))
+            query = query.filter(Task.status == _STATUS_MAP[status])
 
         if priority:
-            query = query.filter(Task.priority == TaskPriorityEnum(priority))
+            query = query.filter(Task.priority == _PRIORITY_MAP[priority])
 
         if assigned_to:
             query = query.filter(Task.assigned_to.ilike(f"%{assigned_to}%"))
 
         if tags:
-            tag_list = [tag.strip() for tag in tags.split(',')]
-            for tag in tag_list:
-                query = query.filter(Task.tags.ilike(f"%{tag}%"))
+            # One AND-ed predicate; blank entries would match every row.
+            # On PostgreSQL ix_tasks_tags_trgm serves the ILIKEs.
+            tag_list = {tag.strip().lower() for tag in tags.split(',') if tag.strip()}
+            if tag_list:
+                query = query.filter(
+                    and_(*[Task.tags.ilike(f"%{tag}%") for tag in sorted(tag_list)])
+                )
 
+        # Blank searches are ignored; near-empty ones would match almost
+        # every row and cannot use the search indexes
+        search = search.strip() if search else None
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (Task.title.ilike(search_term)) |
-                (Task.description.ilike(search_term)) |
-                (Task.assigned_to.ilike(search_term))
-            )
+            if len(search) < _MIN_SEARCH_LENGTH:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"search must be at least {_MIN_SEARCH_LENGTH} characters"
+                )
+            if len(search.split()) > 1 and db.bind.dialect.name == "postgresql":
+                # Multi-word searches match words through the full-text index
+                query = query.filter(
+                    search_document().op("@@")(
+                        func.plainto_tsquery(literal_column("'english'"), search)
+                    )
+                )
+            else:
+                # Single terms keep substring matching; on PostgreSQL the
+                # trigram indexes serve these ILIKEs. One bound pattern is
+                # shared by all three comparisons.
+                search_term = bindparam("search_term", f"%{search}%")
+                query = query.filter(
+                    (Task.title.ilike(search_term)) |
+                    (Task.description.ilike(search_term)) |
+                    (Task.assigned_to.ilike(search_term))
+                )
 
         if due_soon:
             seven_days_from_now = datetime.utcnow() + timedelta(days=7)
@@ -159,68 +429,111 @@ def get_tasks(
                 )
             )
 
-        # Apply sorting
+        keyset = sort_by == "created_at"
+        if cursor:
+            if not keyset:
+                raise HTTPException(
+                    status_code=400,
+                    detail="cursor pagination requires sort_by=created_at"
+                )
+            cursor_created_at, cursor_id = _decode_cursor(cursor)
+            position = tuple_(Task.created_at, Task.id)
+            # Bind with the column types so created_at uses its storage format
+            after = tuple_(
+                literal(cursor_created_at, Task.created_at.type),
+                literal(cursor_id, Task.id.type)
+            )
+            query = query.filter(position < after if sort_desc else position > after)
+
+        # Apply sorting; id breaks ties so that pages never overlap
         sort_column = getattr(Task, sort_by, Task.created_at)
         if sort_desc:
-            query = query.order_by(desc(sort_column))
+            query = query.order_by(desc(sort_column), desc(Task.id))
         else:
-            query = query.order_by(sort_column)
+            query = query.order_by(sort_column, Task.id)
 
         # Apply pagination
-        tasks = query.offset(skip).limit(limit).all()
+        if not cursor:
+            query = query.offset(skip)
+        rows = (await db.execute(query.limit(limit))).all()
+        dependencies = await _load_dependencies(db, [row.id for row in rows])
+
+        # Encoded row by row, so each task dict is dropped as soon as it is
+        # serialized instead of the whole page of dicts being held at once.
+        # The body is not streamed: its ETag and X-Next-Cursor headers
+        # depend on the complete page.
+        body = b"[" + b",".join(
+            orjson.dumps(
+                _row_to_dict(row, dependencies.get(row.id, []), row.progress_percentage)
+            )
+            for row in rows
+        ) + b"]"
+        headers = {"ETag": f'"{hashlib.sha1(body).hexdigest()}"'}
+        if keyset and len(rows) == limit:
+            headers["X-Next-Cursor"] = _encode_cursor(rows[-1])
 
-        return [_convert_task_to_response(task, db) for task in tasks]
+        # Polling clients that already hold this page get an empty 304
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching tasks: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/statistics", response_model=TaskStatistics)
-def get_task_statistics(db: Session = Depends(get_db)):
-    """Get comprehensive task statistics"""
-    try:
-        now = datetime.utcnow()
-
-        # Basic counts by status
-        status_counts = db.query(
-            Task.status, func.count(Task.id)
-        ).group_by(Task.status).all()
-
-        counts = {status.value: count for status, count in status_counts}
+async def get_task_statistics(db: AsyncSession = Depends(get_db)):
+    """
+    Get comprehensive task statistics
 
-        # Priority distribution
-        priority_counts = db.query(
-            Task.priority, func.count(Task.id)
-        ).group_by(Task.priority).all()
-
-        priority_dist = {priority.value: count for priority, count in priority_counts}
-
-        # Overdue tasks
-        overdue_count = db.query(Task).filter(
-            and_(
-                Task.due_date < now,
-                Task.status.in_([TaskStatusEnum.PENDING, TaskStatusEnum.IN_PROGRESS])
-            )
-        ).count()
-
-        # Average completion time for completed tasks
-        completed_tasks = db.query(Task).filter(
-            and_(
-                Task.status == TaskStatusEnum.COMPLETED,
-                Task.completed_at.isnot(None)
-            )
-        ).all()
+    Served from the in-process cache for up to CACHE_TTL_SECONDS; writes
+    through the API clear it.
+    """
+    statistics = cache.get("statistics")
+    if statistics is not None:
+        return statistics
 
-        avg_completion_time = None
-        if completed_tasks:
-            total_time = sum(
-                (task.completed_at - task.created_at).total_seconds() / 3600
-                for task in completed_tasks
-            )
-            avg_completion_time = total_time / len(completed_tasks)
+    try:
+        now = datetime.utcnow()
+        open_statuses = [TaskStatusEnum.PENDING, TaskStatusEnum.IN_PROGRESS]
+        completed = and_(
+            Task.status == TaskStatusEnum.COMPLETED,
+            Task.completed_at.isnot(None)
+        )
 
-        return TaskStatistics(
+        # Every figure is an aggregate over one scan of the table
+        row = (await db.execute(
+            select(
+                *[
+                    func.count().filter(Task.status == status).label(status.name)
+                    for status in TaskStatusEnum
+                ],
+                *[
+                    func.count().filter(Task.priority == priority).label(priority.name)
+                    for priority in TaskPriorityEnum
+                ],
+                func.count().filter(
+                    and_(Task.due_date < now, Task.status.in_(open_statuses))
+                ).label("overdue"),
+                func.avg(
+                    _hours_between(db, Task.created_at, Task.completed_at)
+                ).filter(completed).label("avg_completion_hours")
+            ).select_from(Task)
+        )).mappings().one()
+
+        counts = {status.value: row[status.name] for status in TaskStatusEnum}
+        # Only priorities that occur, as the former GROUP BY returned
+        priority_dist = {
+            priority.value: row[priority.name]
+            for priority in TaskPriorityEnum if row[priority.name]
+        }
+        overdue_count = row["overdue"]
+        avg_completion_time = row["avg_completion_hours"]
+
+        statistics = TaskStatistics(
             total_tasks=sum(counts.values()),
             pending_tasks=counts.get(TaskStatusEnum.PENDING.value, 0),
             in_progress_tasks=counts.get(TaskStatusEnum.IN_PROGRESS.value, 0),
@@ -231,6 +544,8 @@ def get_task_statistics(db: Session = Depends(get_db)):
             tasks_by_priority=priority_dist,
             average_completion_time=avg_completion_time
         )
+        cache.set("statistics", statistics)
+        return statistics
 
     except Exception as e:
         logger.error(f"Error fetching statistics: {str(e)}")
@@ -238,92 +553,164 @@ def get_task_statistics(db: Session = Depends(get_db)):
 
 
 @router.post("/bulk-update", response_model=List[TaskResponse])
-def bulk_update_tasks(
+async def bulk_update_tasks(
     bulk_update: BulkTaskUpdate,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Update multiple tasks at once"""
-    try:
-        tasks = db.query(Task).filter(Task.id.in_(bulk_update.task_ids)).all()
-
-        if len(tasks) != len(bulk_update.task_ids):
-            found_ids = [task.id for task in tasks]
-            missing_ids = set(bulk_update.task_ids) - set(found_ids)
-            raise HTTPException(
-                status_code=404,
-                detail=f"Tasks with IDs {missing_ids} not found"
-            )
+    """
+    Update multiple tasks at once
 
+    All tasks are changed by one UPDATE ... RETURNING; status transitions
+    are checked in its WHERE clause, as in update_task.
+    """
+    try:
+        task_ids = set(bulk_update.task_ids)
         update_data = bulk_update.updates.model_dump(exclude_unset=True)
 
-        # Convert enums
+        # Convert enums and tags to their stored forms
         if 'status' in update_data:
-            update_data['status'] = TaskStatusEnum(update_data['status'])
+            update_data['status'] = _STATUS_MAP[update_data['status']]
         if 'priority' in update_data:
-            update_data['priority'] = TaskPriorityEnum(update_data['priority'])
-
-        # Handle special status transition logic
-        if 'status' in update_data:
-            new_status = update_data['status']
-            for task in tasks:
-                if not task.can_transition_to(new_status):
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Task {task.id} cannot transition from {task.status.value} to {new_status.value}"
-                    )
-
-        # Apply updates
-        for task in tasks:
-            for field, value in update_data.items():
-                setattr(task, field, value)
-
-            # Set completed_at when status changes to completed
-            if 'status' in update_data and update_data['status'] == TaskStatusEnum.COMPLETED:
-                task.completed_at = datetime.utcnow()
+            update_data['priority'] = _PRIORITY_MAP[update_data['priority']]
+        if 'tags' in update_data:
+            tags = update_data.pop('tags')
+            update_data['tags'] = ', '.join(tags) if tags else None
+
+        if update_data:
+            stmt = update(Task).where(Task.id.in_(task_ids))
+            new_status = update_data.get('status')
+            if new_status is not None:
+                stmt = stmt.where(Task.status.in_(Task.statuses_allowing(new_status)))
+
+                # Set completed_at when status changes to completed
+                if new_status == TaskStatusEnum.COMPLETED:
+                    update_data['completed_at'] = datetime.utcnow()
+
+            stmt = stmt.values(
+                **update_data, version=Task.version + 1
+            ).returning(*_TASK_COLUMNS)
+        else:
+            stmt = select(*_TASK_COLUMNS).where(Task.id.in_(task_ids))
+        rows = (await db.execute(stmt)).all()
+
+        if len(rows) != len(task_ids):
+            # Some rows did not match: report missing tasks first, then the
+            # first task whose status may not change
+            await db.rollback()
+            current = dict((await db.execute(
+                select(Task.id, Task.status).where(Task.id.in_(task_ids))
+            )).all())
+            missing_ids = task_ids - current.keys()
+            if missing_ids:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Tasks with IDs {missing_ids} not found"
+                )
+            allowed_from = Task.statuses_allowing(new_status)
+            task_id, status = next(
+                (task_id, status) for task_id, status in sorted(current.items())
+                if status not in allowed_from
+            )
+            raise HTTPException(
+                status_code=400,
+                detail=f"Task {task_id} cannot transition from {status.value} to {new_status.value}"
+            )
 
-        db.commit()
+        rows.sort(key=lambda row: row.id)
+        dependencies = await _load_dependencies(db, [row.id for row in rows])
+        # Encoded row by row, so each task dict is dropped as soon as it is
+        # serialized
+        body = b"[" + b",".join(
+            orjson.dumps(
+                _row_to_dict(row, dependencies.get(row.id, []), row.progress_percentage)
+            )
+            for row in rows
+        ) + b"]"
+        await db.commit()
+        cache.invalidate()
 
         # Return updated tasks
-        return [_convert_task_to_response(task, db) for task in tasks]
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error in bulk update: {str(e)}")
-        db.rollback()
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# Registered before "/{task_id}" so that "count" is not parsed as an id
+@router.get("/count", response_model=dict)
+async def get_task_count(
+    exact: bool = Query(False, description="Always run an exact COUNT(*)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get total count of tasks
+
+    On PostgreSQL the total is read from the planner's row estimate in
+    pg_class unless exact=true; "estimated" tells which one was returned.
+    Other databases always get an exact count. Results are cached like
+    /statistics.
+    """
+    cache_key = f"count:{exact}"
+    result = cache.get(cache_key)
+    if result is not None:
+        return result
+
+    try:
+        result = None
+        if not exact and db.bind.dialect.name == "postgresql":
+            estimate = (await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+                {"table": Task.__tablename__}
+            )).scalar()
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            if estimate is not None and estimate >= 0:
+                result = {"total": estimate, "estimated": True}
+
+        if result is None:
+            # Plain COUNT(*) over the table, without the subquery Query.count() adds
+            total = await db.scalar(select(func.count()).select_from(Task))
+            result = {"total": total, "estimated": False}
+
+        cache.set(cache_key, result)
+        return result
+    except Exception as e:
+        logger.error(f"Error getting task count: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.post("/{task_id}/status-transition", response_model=TaskStatusTransition)
-def check_status_transition(
+async def check_status_transition(
     task_id: int,
     new_status: TaskStatus,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Check if a status transition is allowed for a task"""
     try:
-        task = db.query(Task).filter(Task.id == task_id).first()
+        task = await db.get(Task, task_id)
         if not task:
             raise HTTPException(
                 status_code=404,
                 detail=f"Task with ID {task_id} not found"
             )
 
-        target_status = TaskStatusEnum(new_status)
+        target_status = _STATUS_MAP[new_status]
         current_status = task.status
 
         is_allowed = task.can_transition_to(target_status)
         reason = None
 
         if not is_allowed:
-            allowed_transitions = task.get_allowed_transitions().get(current_status, set())
-            allowed_str = ", ".join(t.value for t in allowed_transitions)
+            allowed_str = ALLOWED_TRANSITIONS_TEXT[current_status]
             reason = f"Cannot transition from {current_status.value} to {target_status.value}. Allowed: {allowed_str}"
 
         return TaskStatusTransition(
             task_id=task_id,
-            current_status=TaskStatus(current_status.value),
+            current_status=current_status.value,
             new_status=new_status,
             is_allowed=is_allowed,
             reason=reason
@@ -337,16 +724,36 @@ def check_status_transition(
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(task_id: int, db: Session = Depends(get_db)):
-    """Get a specific task by ID with all details"""
+async def get_task(task_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Get a specific task by ID with all details
+
+    The response carries an ETag; a request whose If-None-Match matches it
+    gets an empty 304 without the task being loaded or serialized.
+    """
     try:
-        task = db.query(Task).options(joinedload(Task.dependencies)).filter(Task.id == task_id).first()
+        etag = await _task_etag(db, task_id)
+        if etag is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Task with ID {task_id} not found"
+            )
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        # Primary-key get: served from the identity map when the session
+        # already holds the task
+        task = await db.get(
+            Task, task_id, options=[selectinload(Task.dependencies), raiseload("*")]
+        )
         if not task:
             raise HTTPException(
                 status_code=404,
                 detail=f"Task with ID {task_id} not found"
             )
-        return _convert_task_to_response(task, db)
+        response = _task_json_response(task)
+        response.headers["ETag"] = etag
+        return response
 
     except HTTPException:
         raise
@@ -356,116 +763,137 @@ def get_task(task_id: int, db: Session = Depends(get_db)):
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(
+async def update_task(
     task_id: int,
     task_update: TaskUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a specific task by ID with validation"""
     try:
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Task with ID {task_id} not found"
-            )
-
         update_data = task_update.model_dump(exclude_unset=True)
 
-        # Handle status transition validation
-        if 'status' in update_data:
-            new_status = TaskStatusEnum(update_data['status'])
-            if not db_task.can_transition_to(new_status):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Cannot transition from {db_task.status.value} to {new_status.value}"
-                )
-            update_data['status'] = new_status
+        # Handle tags
+        if 'tags' in update_data:
+            tags = update_data.pop('tags')
+            update_data['tags'] = ', '.join(tags) if tags else None
 
         if 'priority' in update_data:
-            update_data['priority'] = TaskPriorityEnum(update_data['priority'])
+            update_data['priority'] = _PRIORITY_MAP[update_data['priority']]
 
-        # Handle tags
-        if 'tags' in update_data:
-            db_task.tags_list = update_data.pop('tags')
+        stmt = update(Task).where(Task.id == task_id)
 
-        # Apply updates
-        for field, value in update_data.items():
-            setattr(db_task, field, value)
+        # Status transitions are validated in the WHERE clause: the row only
+        # matches while its current status may move to the new one
+        new_status = None
+        if 'status' in update_data:
+            new_status = _STATUS_MAP[update_data['status']]
+            update_data['status'] = new_status
+            stmt = stmt.where(Task.status.in_(Task.statuses_allowing(new_status)))
+
+            # Auto-set completed_at when status changes to completed
+            if new_status == TaskStatusEnum.COMPLETED:
+                update_data['completed_at'] = datetime.utcnow()
+            else:
+                update_data['completed_at'] = None
+
+        # The response needs the dependencies; anything else it touches
+        # raises instead of lazy-loading
+        load_options = [selectinload(Task.dependencies), raiseload("*")]
+        if update_data:
+            db_task = (await db.execute(
+                stmt.values(**update_data, version=Task.version + 1)
+                .returning(Task).options(*load_options)
+            )).scalar_one_or_none()
+        else:
+            db_task = await db.get(Task, task_id, options=load_options)
 
-        # Auto-set completed_at when status changes to completed
-        if 'status' in update_data and update_data['status'] == TaskStatusEnum.COMPLETED:
-            db_task.completed_at = datetime.utcnow()
-        elif 'status' in update_data and update_data['status'] != TaskStatusEnum.COMPLETED:
-            db_task.completed_at = None
+        if not db_task:
+            # Nothing matched: the task is missing or the transition is not allowed
+            current_status = await db.scalar(select(Task.status).where(Task.id == task_id))
+            await db.rollback()
+            if current_status is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Task with ID {task_id} not found"
+                )
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot transition from {current_status.value} to {new_status.value}"
+            )
 
-        db.commit()
-        db.refresh(db_task)
-        return _convert_task_to_response(db_task, db)
+        response = _task_json_response(db_task)
+        await db.commit()
+        cache.invalidate()
+        return response
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error updating task {task_id}: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.delete("/{task_id}", status_code=204)
-def delete_task(task_id: int, db: Session = Depends(get_db)):
+async def delete_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a specific task by ID"""
     try:
-        db_task = db.query(Task).filter(Task.id == task_id).first()
-        if not db_task:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Task with ID {task_id} not found"
+        # Two Core statements, no ORM load or relationship cascade. The
+        # task's own dependency links go first so the foreign keys hold on
+        # databases that enforce them; a refused delete rolls them back.
+        await db.execute(
+            delete(task_dependencies).where(task_dependencies.c.parent_id == task_id)
+        )
+
+        # Delete only if no other task depends on this one
+        deleted_id = (await db.execute(
+            delete(Task)
+            .where(
+                Task.id == task_id,
+                ~exists().where(task_dependencies.c.child_id == task_id)
             )
+            .returning(Task.id)
+        )).scalar_one_or_none()
 
-        # Check if other tasks depend on this task
-        dependent_tasks = db.query(Task).join(task_dependencies, task_dependencies.c.parent_id == Task.id).filter(
-            task_dependencies.c.child_id == task_id
-        ).count()
+        if deleted_id is None:
+            await db.rollback()
+            if not await db.scalar(select(exists().where(Task.id == task_id))):
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Task with ID {task_id} not found"
+                )
 
-        if dependent_tasks > 0:
+            # Check if other tasks depend on this task
+            dependent_tasks = await db.scalar(
+                select(func.count()).where(task_dependencies.c.child_id == task_id)
+            )
             raise HTTPException(
                 status_code=400,
                 detail=f"Cannot delete task {task_id} as {dependent_tasks} other tasks depend on it"
             )
 
-        db.delete(db_task)
-        db.commit()
+        await db.commit()
+        cache.invalidate()
 
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error deleting task {task_id}: {str(e)}")
-        db.rollback()
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@router.get("/count", response_model=dict)
-def get_task_count(db: Session = Depends(get_db)):
-    """Get total count of tasks"""
-    try:
-        total = db.query(Task).count()
-        return {"total": total}
-    except Exception as e:
-        logger.error(f"Error getting task count: {str(e)}")
+        await db.rollback()
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @router.get("/status/list", response_model=dict)
-def get_status_list():
+async def get_status_list():
     """Get list of available task statuses"""
-    return {
-        "statuses": [status.value for status in TaskStatusEnum]
-    }
+    return Response(
+        content=_STATUSES_JSON, media_type="application/json", headers=_STATUSES_HEADERS
+    )
 
 
 @router.get("/priority/list", response_model=dict)
-def get_priority_list():
+async def get_priority_list():
     """Get list of available task priorities"""
-    return {
-        "priorities": [priority.value for priority in TaskPriorityEnum]
-    }
\ No newline at end of file
+    return Response(
+        content=_PRIORITIES_JSON, media_type="application/json", headers=_PRIORITIES_HEADERS
+    )
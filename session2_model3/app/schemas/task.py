@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing import Annotated, Any, Literal, Optional, List
 from datetime import datetime
 from enum import Enum
 
@@ -19,8 +19,13 @@ class TaskPriority(str, Enum):
     CRITICAL = "critical"
 
 
+# Trimmed and length-checked inside pydantic-core, so a blank title fails
+# min_length without a Python validator
+TaskTitle = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)]
+
+
 class TaskCreate(BaseModel):
-    title: str = Field(..., min_length=1, max_length=255, description="Task title")
+    title: TaskTitle = Field(..., description="Task title")
     description: Optional[str] = Field(None, max_length=5000, description="Task description")
     status: TaskStatus = Field(TaskStatus.PENDING, description="Task status")
     priority: TaskPriority = Field(TaskPriority.MEDIUM, description="Task priority")
@@ -30,19 +35,15 @@ class TaskCreate(BaseModel):
     tags: Optional[List[str]] = Field(None, description="List of tags")
     dependency_ids: Optional[List[int]] = Field(None, description="List of dependency task IDs")
 
-    @validator('title')
-    def validate_title(cls, v):
-        if not v.strip():
-            raise ValueError('Title cannot be empty')
-        return v.strip()
-
-    @validator('assigned_to')
+    @field_validator('assigned_to')
+    @classmethod
     def validate_assigned_to(cls, v):
         if v and not v.strip():
             return None
         return v.strip() if v else v
 
-    @validator('tags')
+    @field_validator('tags')
+    @classmethod
     def validate_tags(cls, v):
         if v is None:
             return []
@@ -51,9 +52,9 @@ class TaskCreate(BaseModel):
             raise ValueError('Maximum 20 unique tags allowed')
         return unique_tags
 
-    class Config:
-        use_enum_values = True
-        schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "title": "Complete project documentation",
                 "description": "Write comprehensive documentation for the API",
@@ -66,10 +67,11 @@ class TaskCreate(BaseModel):
                 "dependency_ids": [1, 2, 3]
             }
         }
+    )
 
 
 class TaskUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=1, max_length=255, description="Task title")
+    title: Optional[TaskTitle] = Field(None, description="Task title")
     description: Optional[str] = Field(None, max_length=5000, description="Task description")
     status: Optional[TaskStatus] = Field(None, description="Task status")
     priority: Optional[TaskPriority] = Field(None, description="Task priority")
@@ -79,19 +81,15 @@ class TaskUpdate(BaseModel):
     actual_hours: Optional[int] = Field(None, ge=0, le=10000, description="Actual hours spent")
     tags: Optional[List[str]] = Field(None, description="List of tags")
 
-    @validator('title')
-    def validate_title(cls, v):
-        if v is not None and not v.strip():
-            raise ValueError('Title cannot be empty')
-        return v.strip() if v else v
-
-    @validator('assigned_to')
+    @field_validator('assigned_to')
+    @classmethod
     def validate_assigned_to(cls, v):
         if v is not None and not v.strip():
             return None
         return v.strip() if v else v
 
-    @validator('tags')
+    @field_validator('tags')
+    @classmethod
     def validate_tags(cls, v):
         if v is None:
             return None
@@ -100,9 +98,9 @@ class TaskUpdate(BaseModel):
             raise ValueError('Maximum 20 unique tags allowed')
         return unique_tags
 
-    class Config:
-        use_enum_values = True
-        schema_extra = {
+    model_config = ConfigDict(
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "title": "Updated project documentation",
                 "status": "in-progress",
@@ -111,6 +109,7 @@ class TaskUpdate(BaseModel):
                 "tags": ["documentation", "api"]
             }
         }
+    )
 
 
 class TaskDependency(BaseModel):
@@ -118,9 +117,7 @@ class TaskDependency(BaseModel):
     title: str = Field(..., description="Dependency task title")
     status: TaskStatus = Field(..., description="Dependency task status")
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class TaskResponse(BaseModel):
@@ -141,10 +138,10 @@ class TaskResponse(BaseModel):
     is_ready_to_start: bool = Field(..., description="Whether task can be started")
     dependencies: List[TaskDependency] = Field(default_factory=list, description="Task dependencies")
 
-    class Config:
-        from_attributes = True
-        use_enum_values = True
-        schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "title": "Complete project documentation",
@@ -164,14 +161,15 @@ class TaskResponse(BaseModel):
                 "dependencies": []
             }
         }
+    )
 
 
 class BulkTaskUpdate(BaseModel):
-    task_ids: List[int] = Field(..., min_items=1, max_items=100, description="List of task IDs to update")
+    task_ids: List[int] = Field(..., min_length=1, max_length=100, description="List of task IDs to update")
     updates: TaskUpdate = Field(..., description="Updates to apply to all tasks")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "task_ids": [1, 2, 3],
                 "updates": {
@@ -180,6 +178,33 @@ class BulkTaskUpdate(BaseModel):
                 }
             }
         }
+    )
+
+
+class BatchOperation(BaseModel):
+    method: Literal["GET", "POST"] = Field(..., description="HTTP method of the sub-request")
+    url: str = Field(..., description="Task path, e.g. /tasks/1 (GET) or /tasks (POST)")
+    body: Optional[dict] = Field(None, description="TaskCreate payload for POST")
+
+
+class TaskBatchRequest(BaseModel):
+    requests: List[BatchOperation] = Field(..., min_length=1, max_length=100, description="Sub-requests to run")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "requests": [
+                    {"method": "GET", "url": "/tasks/1"},
+                    {"method": "POST", "url": "/tasks", "body": {"title": "New task"}}
+                ]
+            }
+        }
+    )
+
+
+class BatchResult(BaseModel):
+    status: int = Field(..., description="HTTP status the sub-request would have returned")
+    body: Any = Field(None, description="Task, or error detail")
 
 
 class TaskStatusTransition(BaseModel):
@@ -189,8 +214,7 @@ class TaskStatusTransition(BaseModel):
     is_allowed: bool = Field(..., description="Whether transition is allowed")
     reason: Optional[str] = Field(None, description="Reason if transition is not allowed")
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class TaskStatistics(BaseModel):
@@ -204,8 +228,8 @@ class TaskStatistics(BaseModel):
     tasks_by_priority: dict = Field(..., description="Tasks grouped by priority")
     average_completion_time: Optional[float] = Field(None, description="Average completion time in hours")
 
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_tasks": 100,
                 "pending_tasks": 30,
@@ -217,4 +241,5 @@ class TaskStatistics(BaseModel):
                 "tasks_by_priority": {"low": 20, "medium": 50, "high": 25, "critical": 5},
                 "average_completion_time": 38.5
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
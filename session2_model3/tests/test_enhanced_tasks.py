@@ -1,80 +1,197 @@
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from datetime import datetime, timedelta
 import json
+from contextlib import contextmanager
+from functools import lru_cache
 
+import orjson
+
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+
+from app import cache
 from app.main import app
 from app.database import get_db
-from app.models.task import Task, TaskStatus, TaskPriority
+from app.models.task import Task, TaskStatus, TaskPriority, task_dependencies
 
-client = TestClient(app)
+# Requests go straight to the ASGI app on the test's event loop, without
+# TestClient's thread portal
+client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
+# Task creation payload shared by the tests, encoded once. The due date is
+# fixed (and far off) so the bytes never need rebuilding.
+SAMPLE_TASK_DATA = {
+    "title": "Test Task",
+    "description": "This is a test task",
+    "priority": "high",
+    "due_date": "2099-01-01T09:00:00",
+    "assigned_to": "test@example.com",
+    "estimated_hours": 8,
+    "tags": ["test", "sample"]
+}
+JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture
-def db_session():
-    """Create a test database session"""
+
+@lru_cache(maxsize=None)
+def task_payload(**overrides) -> bytes:
+    """
+    Encoded SAMPLE_TASK_DATA with some fields replaced
+
+    Override values must be hashable (tuples for lists); each distinct
+    payload is built and encoded once per run.
+    """
+    return orjson.dumps({**SAMPLE_TASK_DATA, **overrides})
+
+
+SAMPLE_TASK_JSON = task_payload()
+
+
+def json_body(response):
+    """Decode a response body with orjson rather than the stdlib json module"""
+    return orjson.loads(response.content)
+
+
+@contextmanager
+def count_queries():
+    """Collect the SQL statements executed inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+
+
+@contextmanager
+def assert_max_queries(limit):
+    """Fail if the block executes more than limit SQL statements"""
+    with count_queries() as statements:
+        yield statements
+    assert len(statements) <= limit, (
+        f"{len(statements)} queries, expected at most {limit}: {statements}"
+    )
+
+
+def clear_tables(engine):
+    """Empty every table, keeping the schema for the next test"""
+    from app.database import Base
+
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def test_engines(tmp_path_factory):
+    """Create the test database and its schema once for the whole run"""
     from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
     from app.database import Base
 
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:")
+    # Use a temporary SQLite file, shared by the synchronous session the
+    # tests seed data with and the async sessions the app runs on
+    db_path = tmp_path_factory.mktemp("db") / "test.db"
+    engine = create_engine(f"sqlite:///{db_path}")
     Base.metadata.create_all(bind=engine)
 
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Every test runs on its own event loop, so async connections are not
+    # pooled across tests
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    yield engine, async_engine
+
+    engine.dispose()
 
-    # Override the dependency
-    def override_get_db():
-        try:
-            db = TestingSessionLocal()
+
+@pytest.fixture(scope="session", autouse=True)
+def override_database(test_engines):
+    """Point the app's get_db at the test database for the whole run"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    _, async_engine = test_engines
+    AsyncTestingSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with AsyncTestingSessionLocal() as db:
             yield db
-        finally:
-            db.close()
 
     app.dependency_overrides[get_db] = override_get_db
-    yield TestingSessionLocal()
-
-    # Clean up
+    yield
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def sample_task_data():
-    """Sample task data for testing"""
-    return {
-        "title": "Test Task",
-        "description": "This is a test task",
-        "priority": "high",
-        "due_date": (datetime.utcnow() + timedelta(days=7)).isoformat(),
-        "assigned_to": "test@example.com",
-        "estimated_hours": 8,
-        "tags": ["test", "sample"]
-    }
+def db_session(test_engines):
+    """Create a test database session; rows are deleted after the test"""
+    from sqlalchemy.orm import sessionmaker
+
+    engine, _ = test_engines
+    # Seeded objects keep their attributes after commit, so reading e.g.
+    # task.id does not issue a refresh SELECT
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
+
+    cache.invalidate()
+    session = TestingSessionLocal()
+    yield session
+
+    # Clean up
+    session.close()
+    clear_tables(engine)
+
+
+# Column values shared by the bulk-inserted test tasks; rows override them
+TASK_ROW = {"status": TaskStatus.PENDING, "priority": TaskPriority.MEDIUM}
+
+
+def insert_tasks(session, rows):
+    """
+    Insert task rows with one Core INSERT ... RETURNING and commit
+
+    Skips the ORM unit of work entirely. Returns a row per task, in the
+    order of rows, carrying only the generated id.
+    """
+    tasks = session.execute(
+        insert(Task.__table__).returning(Task.__table__.c.id, sort_by_parameter_order=True),
+        rows
+    ).all()
+    session.commit()
+    return tasks
 
 
 class TestTaskCreation:
     """Test task creation endpoints"""
 
-    def test_create_basic_task(self, db_session, sample_task_data):
+    async def test_create_basic_task(self, db_session):
         """Test creating a basic task"""
-        response = client.post("/api/v1/tasks/", json=sample_task_data)
+        response = await client.post(
+            "/api/v1/tasks/", content=SAMPLE_TASK_JSON, headers=JSON_HEADERS
+        )
 
         assert response.status_code == 201
-        data = response.json()
+        data = json_body(response)
 
-        assert data["title"] == sample_task_data["title"]
-        assert data["description"] == sample_task_data["description"]
+        assert data["title"] == SAMPLE_TASK_DATA["title"]
+        assert data["description"] == SAMPLE_TASK_DATA["description"]
         assert data["status"] == "pending"
         assert data["priority"] == "high"
-        assert data["assigned_to"] == sample_task_data["assigned_to"]
-        assert data["estimated_hours"] == sample_task_data["estimated_hours"]
-        assert set(data["tags"]) == set(sample_task_data["tags"])
+        assert data["assigned_to"] == SAMPLE_TASK_DATA["assigned_to"]
+        assert data["estimated_hours"] == SAMPLE_TASK_DATA["estimated_hours"]
+        assert set(data["tags"]) == set(SAMPLE_TASK_DATA["tags"])
         assert data["progress_percentage"] == 0.0
         assert "id" in data
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_create_task_with_dependencies(self, db_session, sample_task_data):
+    async def test_create_task_with_dependencies(self, db_session):
         """Test creating a task with dependencies"""
         # First create a dependency task
         dep_task = Task(
@@ -87,78 +204,92 @@ class TestTaskCreation:
         db_session.commit()
 
         # Create task with dependency
-        sample_task_data["dependency_ids"] = [dep_task.id]
-        response = client.post("/api/v1/tasks/", json=sample_task_data)
+        payload = task_payload(dependency_ids=(dep_task.id,))
+        response = await client.post("/api/v1/tasks/", content=payload, headers=JSON_HEADERS)
 
         assert response.status_code == 201
-        data = response.json()
+        data = json_body(response)
         assert len(data["dependencies"]) == 1
         assert data["dependencies"][0]["id"] == dep_task.id
         assert data["is_ready_to_start"] == True  # Dependency is completed
 
-    def test_create_task_invalid_dependencies(self, db_session, sample_task_data):
+    async def test_create_task_invalid_dependencies(self, db_session):
         """Test creating a task with non-existent dependencies"""
-        sample_task_data["dependency_ids"] = [999]
-        response = client.post("/api/v1/tasks/", json=sample_task_data)
+        payload = task_payload(dependency_ids=(999,))
+        response = await client.post("/api/v1/tasks/", content=payload, headers=JSON_HEADERS)
 
         assert response.status_code == 400
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
 
-    def test_create_task_invalid_tags(self, db_session, sample_task_data):
+    async def test_create_task_invalid_tags(self, db_session):
         """Test creating a task with too many tags"""
-        sample_task_data["tags"] = [f"tag{i}" for i in range(25)]
-        response = client.post("/api/v1/tasks/", json=sample_task_data)
+        payload = task_payload(tags=tuple(f"tag{i}" for i in range(25)))
+        response = await client.post("/api/v1/tasks/", content=payload, headers=JSON_HEADERS)
 
         assert response.status_code == 422
-        assert "Maximum 20 unique tags" in str(response.json())
+        assert "Maximum 20 unique tags" in str(json_body(response))
 
 
 class TestTaskRetrieval:
     """Test task retrieval endpoints"""
 
-    @pytest.fixture
-    def sample_tasks(self, db_session):
-        """Create sample tasks for testing"""
-        tasks = [
-            Task(
-                title="Task 1",
-                description="First task",
-                status=TaskStatus.PENDING,
-                priority=TaskPriority.HIGH,
-                due_date=datetime.utcnow() + timedelta(days=1),
-                assigned_to="user1@example.com",
-                tags_list=["urgent", "backend"]
-            ),
-            Task(
-                title="Task 2",
-                description="Second task",
-                status=TaskStatus.IN_PROGRESS,
-                priority=TaskPriority.MEDIUM,
-                due_date=datetime.utcnow() - timedelta(days=1),  # Overdue
-                assigned_to="user2@example.com",
-                tags_list=["frontend", "ui"]
-            ),
-            Task(
-                title="Task 3",
-                description="Third task",
-                status=TaskStatus.COMPLETED,
-                priority=TaskPriority.LOW,
-                tags_list=["documentation"]
-            )
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sample_tasks(cls, test_engines):
+        """
+        Create sample tasks once for the class
+
+        The tests here only read, so they share one dataset; it is deleted
+        when the class finishes.
+        """
+        from sqlalchemy.orm import Session
+
+        engine, _ = test_engines
+        # One reference time, so the due dates sit exactly a day either side
+        now = datetime.utcnow()
+        rows = [
+            {
+                "title": "Task 1",
+                "description": "First task",
+                "status": TaskStatus.PENDING,
+                "priority": TaskPriority.HIGH,
+                "due_date": now + timedelta(days=1),
+                "assigned_to": "user1@example.com",
+                "tags": "urgent, backend"
+            },
+            {
+                "title": "Task 2",
+                "description": "Second task",
+                "status": TaskStatus.IN_PROGRESS,
+                "priority": TaskPriority.MEDIUM,
+                "due_date": now - timedelta(days=1),  # Overdue
+                "assigned_to": "user2@example.com",
+                "tags": "frontend, ui"
+            },
+            {
+                "title": "Task 3",
+                "description": "Third task",
+                "status": TaskStatus.COMPLETED,
+                "priority": TaskPriority.LOW,
+                "due_date": None,
+                "assigned_to": None,
+                "tags": "documentation"
+            }
         ]
 
-        for task in tasks:
-            db_session.add(task)
-        db_session.commit()
+        with Session(engine, expire_on_commit=False) as session:
+            tasks = insert_tasks(session, rows)
+        cache.invalidate()
+        yield tasks
 
-        return tasks
+        clear_tables(engine)
 
-    def test_get_all_tasks(self, sample_tasks):
+    async def test_get_all_tasks(self, sample_tasks):
         """Test retrieving all tasks"""
-        response = client.get("/api/v1/tasks/")
+        response = await client.get("/api/v1/tasks/")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data) == 3
 
         # Check that tasks have all expected fields
@@ -170,84 +301,119 @@ class TestTaskRetrieval:
             assert "tags" in task
             assert isinstance(task["tags"], list)
 
-    def test_filter_tasks_by_status(self, sample_tasks):
-        """Test filtering tasks by status"""
-        response = client.get("/api/v1/tasks/?status=pending")
+    async def test_get_all_tasks_query_count(self, sample_tasks):
+        """Listing tasks costs the same few queries however many tasks match"""
+        # The page, then the dependencies of all its tasks in one IN query
+        with assert_max_queries(2):
+            response = await client.get("/api/v1/tasks/")
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["status"] == "pending"
-
-    def test_filter_tasks_by_priority(self, sample_tasks):
-        """Test filtering tasks by priority"""
-        response = client.get("/api/v1/tasks/?priority=high")
+        assert len(json_body(response)) == 3
+
+    @pytest.mark.parametrize("query,field,value", [
+        ("status=pending", "status", "pending"),
+        ("priority=high", "priority", "high"),
+        ("assigned_to=user1@example.com", "assigned_to", "user1@example.com"),
+        ("tags=frontend", "tags", ["frontend", "ui"]),
+    ])
+    async def test_filter_tasks(self, sample_tasks, query, field, value):
+        """Test filtering tasks by status, priority, assignee and tags"""
+        with assert_max_queries(2):
+            response = await client.get(f"/api/v1/tasks/?{query}")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data) == 1
-        assert data[0]["priority"] == "high"
+        assert data[0][field] == value
 
-    def test_filter_tasks_by_assignee(self, sample_tasks):
-        """Test filtering tasks by assignee"""
-        response = client.get("/api/v1/tasks/?assigned_to=user1@example.com")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["assigned_to"] == "user1@example.com"
-
-    def test_filter_tasks_by_tags(self, sample_tasks):
-        """Test filtering tasks by tags"""
-        response = client.get("/api/v1/tasks/?tags=frontend")
+    async def test_search_tasks(self, sample_tasks):
+        """Test searching tasks"""
+        response = await client.get("/api/v1/tasks/?search=Second")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data) == 1
-        assert "frontend" in data[0]["tags"]
+        assert "Second" in data[0]["description"]
 
-    def test_search_tasks(self, sample_tasks):
-        """Test searching tasks"""
-        response = client.get("/api/v1/tasks/?search=Second")
+    async def test_search_too_short(self):
+        """Test that one-character searches are rejected and blank ones ignored"""
+        response = await client.get("/api/v1/tasks/?search=a")
+        assert response.status_code == 400
 
+        response = await client.get("/api/v1/tasks/?search=%20")
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert "Second" in data[0]["title"]
 
-    def test_filter_overdue_tasks(self, sample_tasks):
+    async def test_filter_overdue_tasks(self, sample_tasks):
         """Test filtering overdue tasks"""
-        response = client.get("/api/v1/tasks/?overdue=true")
+        with assert_max_queries(2):
+            response = await client.get("/api/v1/tasks/?overdue=true")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         # Should include the overdue task (Task 2)
         overdue_tasks = [t for t in data if t["id"] == sample_tasks[1].id]
         assert len(overdue_tasks) == 1
 
-    def test_pagination(self, sample_tasks):
+    async def test_pagination(self, sample_tasks):
         """Test task pagination"""
-        response = client.get("/api/v1/tasks/?skip=1&limit=1")
+        response = await client.get("/api/v1/tasks/?skip=1&limit=1")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data) == 1
 
-    def test_sort_tasks(self, sample_tasks):
+    async def test_cursor_pagination(self, sample_tasks):
+        """Test walking all pages with the next-page cursor"""
+        seen = []
+        cursor = None
+        for _ in range(len(sample_tasks) + 1):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get("/api/v1/tasks/", params=params)
+            assert response.status_code == 200
+            seen.extend(t["id"] for t in json_body(response))
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert sorted(seen) == sorted(t.id for t in sample_tasks)
+        assert len(seen) == len(set(seen))
+
+    async def test_invalid_cursor(self):
+        """Test that a malformed cursor is rejected"""
+        response = await client.get("/api/v1/tasks/?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    async def test_get_task_not_modified(self, sample_tasks):
+        """Test that a matching If-None-Match gets an empty 304"""
+        url = f"/api/v1/tasks/{sample_tasks[0].id}"
+        response = await client.get(url)
+        etag = response.headers["ETag"]
+
+        response = await client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = await client.get("/api/v1/tasks/")
+        response = await client.get("/api/v1/tasks/", headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304
+
+    async def test_sort_tasks(self, sample_tasks):
         """Test task sorting"""
-        response = client.get("/api/v1/tasks/?sort_by=title&sort_desc=false")
+        response = await client.get("/api/v1/tasks/?sort_by=title&sort_desc=false")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         titles = [task["title"] for task in data]
         assert titles == sorted(titles)
 
-    def test_get_task_statistics(self, sample_tasks):
+    async def test_get_task_statistics(self, sample_tasks):
         """Test getting task statistics"""
-        response = client.get("/api/v1/tasks/statistics")
+        response = await client.get("/api/v1/tasks/statistics")
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
 
         assert data["total_tasks"] == 3
         assert data["pending_tasks"] == 1
@@ -274,77 +440,97 @@ class TestTaskUpdate:
         db_session.commit()
         return task
 
-    def test_update_task_title(self, existing_task):
+    @pytest.fixture
+    def existing_in_progress_task(self, db_session):
+        """Create a task that is already in progress, ready to complete"""
+        [task] = insert_tasks(db_session, [
+            {**TASK_ROW, "title": "Started Task", "status": TaskStatus.IN_PROGRESS}
+        ])
+        return task
+
+    async def test_update_task_title(self, existing_task):
         """Test updating task title"""
         update_data = {"title": "Updated Task Title"}
-        response = client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
+        response = await client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["title"] == "Updated Task Title"
         assert data["description"] == "Original description"  # Unchanged
 
-    def test_update_task_status_valid_transition(self, existing_task):
+    async def test_update_task_status_valid_transition(self, existing_task):
         """Test updating task status with valid transition"""
         update_data = {"status": "in-progress"}
-        response = client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
+        response = await client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["status"] == "in-progress"
         assert data["progress_percentage"] == 50.0
 
-    def test_update_task_status_invalid_transition(self, existing_task):
+    async def test_update_task_status_invalid_transition(self, existing_task):
         """Test updating task status with invalid transition"""
         update_data = {"status": "completed"}  # Can't go from pending to completed directly
-        response = client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
+        response = await client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
 
         assert response.status_code == 400
-        assert "Cannot transition" in response.json()["detail"]
+        assert "Cannot transition" in json_body(response)["detail"]
 
-    def test_update_task_with_tags(self, existing_task):
+    async def test_update_task_with_tags(self, existing_task):
         """Test updating task tags"""
         update_data = {"tags": ["new", "tags", "here"]}
-        response = client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
+        response = await client.put(f"/api/v1/tasks/{existing_task.id}", json=update_data)
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert set(data["tags"]) == {"new", "tags", "here"}
 
-    def test_complete_task_sets_completed_at(self, existing_task):
+    async def test_complete_task_sets_completed_at(self, existing_in_progress_task):
         """Test that completing a task sets the completed_at timestamp"""
-        # First transition to in-progress
-        client.put(f"/api/v1/tasks/{existing_task.id}", json={"status": "in-progress"})
-
-        # Then complete
-        response = client.put(f"/api/v1/tasks/{existing_task.id}", json={"status": "completed"})
+        response = await client.put(
+            f"/api/v1/tasks/{existing_in_progress_task.id}", json={"status": "completed"}
+        )
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["status"] == "completed"
         assert data["progress_percentage"] == 100.0
         assert data["completed_at"] is not None
 
 
+    async def test_task_etag_changes_on_every_write(self, existing_task):
+        """Test that writes within the same second still change the ETag"""
+        payload = task_payload(dependency_ids=(existing_task.id,))
+        response = await client.post("/api/v1/tasks/", content=payload, headers=JSON_HEADERS)
+        url = f"/api/v1/tasks/{json_body(response)['id']}"
+        etags = [(await client.get(url)).headers["ETag"]]
+
+        await client.put(url, json={"title": "Renamed"})
+        etags.append((await client.get(url)).headers["ETag"])
+
+        # The response embeds dependency statuses, so writing one counts too
+        await client.put(f"/api/v1/tasks/{existing_task.id}", json={"status": "in-progress"})
+        response = await client.get(url, headers={"If-None-Match": ", ".join(etags)})
+        assert response.status_code == 200
+        assert json_body(response)["dependencies"][0]["status"] == "in-progress"
+        etags.append(response.headers["ETag"])
+
+        assert len(set(etags)) == 3
+
+
 class TestBulkOperations:
     """Test bulk operation endpoints"""
 
     @pytest.fixture
     def multiple_tasks(self, db_session):
         """Create multiple tasks for bulk operations"""
-        tasks = [
-            Task(title="Task 1", status=TaskStatus.PENDING, priority=TaskPriority.MEDIUM),
-            Task(title="Task 2", status=TaskStatus.PENDING, priority=TaskPriority.MEDIUM),
-            Task(title="Task 3", status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH),
-        ]
-
-        for task in tasks:
-            db_session.add(task)
-        db_session.commit()
+        return insert_tasks(db_session, [
+            {**TASK_ROW, "title": "Task 1"},
+            {**TASK_ROW, "title": "Task 2"},
+            {**TASK_ROW, "title": "Task 3", "status": TaskStatus.IN_PROGRESS, "priority": TaskPriority.HIGH},
+        ])
 
-        return tasks
-
-    def test_bulk_update_status(self, multiple_tasks):
+    async def test_bulk_update_status(self, multiple_tasks):
         """Test bulk updating task status"""
         task_ids = [task.id for task in multiple_tasks[:2]]
         bulk_data = {
@@ -352,15 +538,15 @@ class TestBulkOperations:
             "updates": {"status": "on-hold"}
         }
 
-        response = client.post("/api/v1/tasks/bulk-update", json=bulk_data)
+        response = await client.post("/api/v1/tasks/bulk-update", json=bulk_data)
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert len(data) == 2
         for task in data:
             assert task["status"] == "on-hold"
 
-    def test_bulk_update_invalid_status_transition(self, multiple_tasks):
+    async def test_bulk_update_invalid_status_transition(self, multiple_tasks):
         """Test bulk update with invalid status transition"""
         task_ids = [task.id for task in multiple_tasks[:2]]
         bulk_data = {
@@ -368,29 +554,50 @@ class TestBulkOperations:
             "updates": {"status": "completed"}  # Can't go from pending to completed
         }
 
-        response = client.post("/api/v1/tasks/bulk-update", json=bulk_data)
+        response = await client.post("/api/v1/tasks/bulk-update", json=bulk_data)
 
         assert response.status_code == 400
-        assert "cannot transition" in response.json()["detail"]
+        assert "cannot transition" in json_body(response)["detail"]
 
-    def test_bulk_update_nonexistent_tasks(self, multiple_tasks):
+    async def test_bulk_update_nonexistent_tasks(self, multiple_tasks):
         """Test bulk update with non-existent task IDs"""
         bulk_data = {
             "task_ids": [999, 1000],
             "updates": {"priority": "high"}
         }
 
-        response = client.post("/api/v1/tasks/bulk-update", json=bulk_data)
+        response = await client.post("/api/v1/tasks/bulk-update", json=bulk_data)
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
+
+    async def test_batch_reads_and_creates(self, multiple_tasks):
+        """Test running reads and creates in one batch request"""
+        batch_data = {
+            "requests": [
+                {"method": "GET", "url": f"/tasks/{multiple_tasks[0].id}"},
+                {"method": "POST", "url": "/tasks", "body": {"title": "Batch Task"}},
+                {"method": "GET", "url": "/tasks/999"},
+                {"method": "POST", "url": "/tasks", "body": {"title": ""}},
+                {"method": "GET", "url": "/tasks"}
+            ]
+        }
+
+        response = await client.post("/api/v1/tasks/batch", json=batch_data)
+
+        assert response.status_code == 200
+        results = json_body(response)
+        assert [result["status"] for result in results] == [200, 201, 404, 422, 400]
+        assert results[0]["body"]["title"] == "Task 1"
+        assert results[1]["body"]["title"] == "Batch Task"
+        assert (await client.get(f"/api/v1/tasks/{results[1]['body']['id']}")).status_code == 200
 
 
 class TestStatusTransitions:
     """Test status transition validation"""
 
     @pytest.fixture
-    def test_task(self, db_session):
+    async def test_task(self, db_session):
         """Create a test task for transition testing"""
         task = Task(
             title="Test Task",
@@ -401,140 +608,130 @@ class TestStatusTransitions:
         db_session.commit()
         return task
 
-    def test_check_valid_status_transition(self, test_task):
+    async def test_check_valid_status_transition(self, test_task):
         """Test checking a valid status transition"""
-        response = client.post(
+        response = await client.post(
             f"/api/v1/tasks/{test_task.id}/status-transition?new_status=in-progress"
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["is_allowed"] == True
         assert data["current_status"] == "pending"
         assert data["new_status"] == "in-progress"
         assert data["reason"] is None
 
-    def test_check_invalid_status_transition(self, test_task):
+    async def test_check_invalid_status_transition(self, test_task):
         """Test checking an invalid status transition"""
-        response = client.post(
+        response = await client.post(
             f"/api/v1/tasks/{test_task.id}/status-transition?new_status=completed"
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = json_body(response)
         assert data["is_allowed"] == False
         assert data["reason"] is not None
         assert "Cannot transition" in data["reason"]
 
-    def test_check_transition_nonexistent_task(self):
+    async def test_check_transition_nonexistent_task(self):
         """Test checking status transition for non-existent task"""
-        response = client.post(
+        response = await client.post(
             "/api/v1/tasks/999/status-transition?new_status=in-progress"
         )
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
 
 
 class TestTaskDependencies:
     """Test task dependency functionality"""
 
-    def test_task_dependency_blocking(self, db_session):
+    async def test_task_dependency_blocking(self, db_session):
         """Test that incomplete dependencies block task"""
-        # Create a dependent task
-        dependency = Task(
-            title="Dependency",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.HIGH
-        )
-        db_session.add(dependency)
-        db_session.commit()
-
-        # Create a task that depends on the above
-        main_task = Task(
-            title="Main Task",
-            status=TaskStatus.PENDING,
-            priority=TaskPriority.MEDIUM
+        # Create a dependency and a task that depends on it, then link them
+        # with a Core insert into the association table; one commit
+        dependency, main_task = db_session.execute(
+            insert(Task.__table__).returning(Task.__table__.c.id, sort_by_parameter_order=True),
+            [
+                {**TASK_ROW, "title": "Dependency", "priority": TaskPriority.HIGH},
+                {**TASK_ROW, "title": "Main Task"}
+            ]
+        ).all()
+        db_session.execute(
+            task_dependencies.insert(),
+            [{"parent_id": main_task.id, "child_id": dependency.id}]
         )
-        db_session.add(main_task)
-        db_session.commit()
-
-        # Add dependency relationship
-        main_task.dependencies.append(dependency)
         db_session.commit()
 
-        response = client.get(f"/api/v1/tasks/{main_task.id}")
-        data = response.json()
+        # ETag lookup, the task, and its dependencies in one IN query
+        with assert_max_queries(3):
+            response = await client.get(f"/api/v1/tasks/{main_task.id}")
+        data = json_body(response)
 
         assert data["is_ready_to_start"] == False
         assert len(data["dependencies"]) == 1
         assert data["dependencies"][0]["status"] == "pending"
 
-    def test_delete_task_with_dependents_fails(self, db_session):
+    async def test_delete_task_with_dependents_fails(self, db_session):
         """Test that deleting a task with dependents fails"""
-        # Create two tasks
+        # Create two tasks, task2 depending on task1
         task1 = Task(title="Task 1", status=TaskStatus.PENDING)
-        task2 = Task(title="Task 2", status=TaskStatus.PENDING)
+        task2 = Task(title="Task 2", status=TaskStatus.PENDING, dependencies=[task1])
 
-        db_session.add(task1)
-        db_session.add(task2)
-        db_session.commit()
-
-        # Make task2 depend on task1
-        task2.dependencies.append(task1)
+        db_session.add_all([task1, task2])
         db_session.commit()
 
         # Try to delete task1 (should fail)
-        response = client.delete(f"/api/v1/tasks/{task1.id}")
+        response = await client.delete(f"/api/v1/tasks/{task1.id}")
 
         assert response.status_code == 400
-        assert "depend on it" in response.json()["detail"]
+        assert "depend on it" in json_body(response)["detail"]
 
 
 class TestErrorHandling:
     """Test error handling and edge cases"""
 
-    def test_get_nonexistent_task(self):
+    async def test_get_nonexistent_task(self):
         """Test getting a non-existent task"""
-        response = client.get("/api/v1/tasks/999")
+        response = await client.get("/api/v1/tasks/999")
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
 
-    def test_update_nonexistent_task(self):
+    async def test_update_nonexistent_task(self):
         """Test updating a non-existent task"""
-        response = client.put("/api/v1/tasks/999", json={"title": "New Title"})
+        response = await client.put("/api/v1/tasks/999", json={"title": "New Title"})
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
 
-    def test_delete_nonexistent_task(self):
+    async def test_delete_nonexistent_task(self):
         """Test deleting a non-existent task"""
-        response = client.delete("/api/v1/tasks/999")
+        response = await client.delete("/api/v1/tasks/999")
 
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"]
+        assert "not found" in json_body(response)["detail"]
 
-    def test_create_task_invalid_data(self, db_session):
+    async def test_create_task_invalid_data(self, db_session):
         """Test creating a task with invalid data"""
         invalid_data = {
             "title": "",  # Empty title
             "estimated_hours": -5,  # Negative hours
         }
 
-        response = client.post("/api/v1/tasks/", json=invalid_data)
+        response = await client.post("/api/v1/tasks/", json=invalid_data)
 
         assert response.status_code == 422  # Validation error
 
-    def test_invalid_query_parameters(self, db_session):
+    async def test_invalid_query_parameters(self, db_session):
         """Test invalid query parameters"""
-        response = client.get("/api/v1/tasks/?limit=1001")  # Over limit
+        response = await client.get("/api/v1/tasks/?limit=1001")  # Over limit
 
         assert response.status_code == 422
 
-    def test_invalid_status_value(self, db_session):
+    async def test_invalid_status_value(self, db_session):
         """Test invalid status value in update"""
-        response = client.put("/api/v1/tasks/1", json={"status": "invalid_status"})
+        response = await client.put("/api/v1/tasks/1", json={"status": "invalid_status"})
 
         assert response.status_code == 422
 
@@ -542,41 +739,48 @@ class TestErrorHandling:
 class TestAPIConsistency:
     """Test API consistency and data integrity"""
 
-    def test_task_count_consistency(self, db_session):
+    async def test_task_count_consistency(self, db_session):
         """Test that task count endpoint matches actual count"""
         # Create some tasks
-        for i in range(5):
-            task = Task(title=f"Task {i}", status=TaskStatus.PENDING)
-            db_session.add(task)
-
+        db_session.execute(insert(Task.__table__), [
+            {**TASK_ROW, "title": f"Task {i}"} for i in range(5)
+        ])
         db_session.commit()
 
         # Check count
-        count_response = client.get("/api/v1/tasks/count")
-        tasks_response = client.get("/api/v1/tasks/")
+        count_response = await client.get("/api/v1/tasks/count")
+        tasks_response = await client.get("/api/v1/tasks/")
 
         assert count_response.status_code == 200
         assert tasks_response.status_code == 200
 
-        count = count_response.json()["total"]
-        tasks = tasks_response.json()
+        count = json_body(count_response)["total"]
+        tasks = json_body(tasks_response)
 
         assert count == len(tasks)
         assert count == 5
 
-    def test_datetime_consistency(self, db_session):
+    async def test_statistics_cache_invalidated_by_writes(self, db_session):
+        """Test that creating a task refreshes the cached statistics"""
+        before = json_body(await client.get("/api/v1/tasks/statistics"))["total_tasks"]
+        await client.post("/api/v1/tasks/", content=SAMPLE_TASK_JSON, headers=JSON_HEADERS)
+        after = json_body(await client.get("/api/v1/tasks/statistics"))["total_tasks"]
+
+        assert after == before + 1
+
+    async def test_datetime_consistency(self, db_session):
         """Test datetime field consistency"""
-        before_create = datetime.utcnow()
+        before_create = datetime.utcnow().replace(microsecond=0)
 
         task_data = {
             "title": "Time Test Task",
             "description": "Testing timestamps"
         }
 
-        response = client.post("/api/v1/tasks/", json=task_data)
+        response = await client.post("/api/v1/tasks/", json=task_data)
         assert response.status_code == 201
 
-        data = response.json()
+        data = json_body(response)
 
         # Parse timestamps
         created_at = datetime.fromisoformat(data["created_at"].replace('Z', '+00:00'))